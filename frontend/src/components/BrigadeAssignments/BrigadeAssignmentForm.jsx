@@ -2,11 +2,10 @@ import React, { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { useQuery } from "../../hooks/useQuery";
 import {
-  getBrigadeAssignmentsBulk,
-  getEducationalPlanEntries,
+  getBrigadeMatrix,
+  saveBrigadeMatrix,
   searchGroupEducationalPlans,
   searchTeachers,
-  bulkUpdateBrigadeAssignments,
 } from "../../services/api";
 import { useAutocomplete } from "../../hooks/useAutocomplete";
 import StepsNav from "../StepsNav";
@@ -23,7 +22,10 @@ function BrigadeAssignmentForm() {
     useState(initialGroupPlan);
   const [educationalPlanEntry, setEducationalPlanEntry] =
     useState(initialPlanEntry);
-  const [entries, setEntries] = useState([]);
+  // Матрица «записи плана × бригады» всей привязки плана к группе:
+  // загружается и сохраняется одним запросом.
+  const [matrix, setMatrix] = useState(null);
+  const entries = matrix ? matrix.entries : [];
 
   const [brigades, setBrigades] = useState([
     {
@@ -52,35 +54,35 @@ function BrigadeAssignmentForm() {
   const groupPlanAutocomplete = useAutocomplete(searchGroupEducationalPlans);
 
   useEffect(() => {
-    if (groupEducationalPlan && educationalPlanEntry) {
-      getBrigadeAssignmentsBulk(groupEducationalPlan, educationalPlanEntry)
-        .then((response) => {
-          const data = response.data;
-          const updated = brigades.map((b) => {
-            const found = data.find(
-              (d) => d.brigade_number === b.brigade_number,
-            );
-            return found
-              ? {
-                  ...b,
-                  teacher: found.teacher,
-                  teacherQuery: found.teacher_name,
-                }
-              : b;
-          });
-          setBrigades(updated);
-        })
-        .catch((error) =>
-          console.error("Ошибка при загрузке назначений:", error),
-        );
-
-      getEducationalPlanEntries(groupEducationalPlan)
-        .then((res) => setEntries(res.data))
-        .catch((err) =>
-          console.error("Ошибка при загрузке записей плана:", err),
-        );
+    if (!groupEducationalPlan) {
+      return;
     }
-  }, [groupEducationalPlan, educationalPlanEntry]);
+    getBrigadeMatrix(groupEducationalPlan)
+      .then((response) => setMatrix(response.data))
+      .catch((error) =>
+        console.error("Ошибка при загрузке назначений:", error),
+      );
+  }, [groupEducationalPlan]);
+
+  useEffect(() => {
+    const row = entries.find(
+      (entry) =>
+        String(entry.educational_plan_entry) === String(educationalPlanEntry),
+    );
+    const updated = brigades.map((b) => {
+      const cell = row
+        ? row.brigades.find((c) => c.brigade_number === b.brigade_number)
+        : null;
+      return {
+        ...b,
+        teacher: cell && cell.teacher ? cell.teacher : "",
+        teacherQuery: cell && cell.teacher_name ? cell.teacher_name : "",
+        teacherSuggestions: [],
+        _activeIndex: -1,
+      };
+    });
+    setBrigades(updated);
+  }, [matrix, educationalPlanEntry]);
 
   const handleTeacherQueryChange = (event, index) => {
     const value = event.target.value;
@@ -138,39 +140,36 @@ function BrigadeAssignmentForm() {
   };
 
   const handleSelectGroupPlan = (plan) => {
+    setMatrix(null);
     setGroupEducationalPlan(plan.id);
     setEducationalPlanEntry("");
     groupPlanAutocomplete.setQuery(
       `${plan.group_name} - ${plan.educational_plan_name}`,
     );
     groupPlanAutocomplete.setSuggestions([]);
-    getEducationalPlanEntries(plan.educational_plan)
-      .then((response) => {
-        if (Array.isArray(response.data)) {
-          setEntries(response.data);
-        } else {
-          setEntries([]);
-          console.error("Ожидали массив записей, получили:", response.data);
-        }
-      })
-      .catch((error) =>
-        console.error("Ошибка при загрузке записей плана:", error),
-      );
   };
 
   const handleSubmit = (event) => {
     event.preventDefault();
-    const filteredBrigades = brigades.map((b) => ({
-      brigade_number: b.brigade_number,
-      teacher: b.teacher,
-    }));
-    const assignmentData = {
+    const current = parseInt(educationalPlanEntry, 10);
+    const matrixData = {
       group_educational_plan: parseInt(groupEducationalPlan, 10),
-      educational_plan_entry: parseInt(educationalPlanEntry, 10),
-      brigades: filteredBrigades,
+      entries: entries.map((row) => ({
+        educational_plan_entry: row.educational_plan_entry,
+        brigades:
+          row.educational_plan_entry === current
+            ? brigades.map((b) => ({
+                brigade_number: b.brigade_number,
+                teacher: b.teacher || null,
+              }))
+            : row.brigades.map((c) => ({
+                brigade_number: c.brigade_number,
+                teacher: c.teacher,
+              })),
+      })),
     };
 
-    bulkUpdateBrigadeAssignments(assignmentData)
+    saveBrigadeMatrix(matrixData)
       .then(() => {
         toast.success("Назначения сохранены!");
         navigate("/brigade_assignments");
@@ -182,7 +181,7 @@ function BrigadeAssignmentForm() {
   };
 
   return (
-    <div className="container mt-4">
+    <form className="container mt-4" onSubmit={handleSubmit}>
       <StepsNav currentStep={7} />
       <h1>
         {groupEducationalPlan && educationalPlanEntry
@@ -243,7 +242,10 @@ function BrigadeAssignmentForm() {
         >
           <option value="">-- выберите --</option>
           {entries.map((entry) => (
-            <option key={entry.id} value={entry.id}>
+            <option
+              key={entry.educational_plan_entry}
+              value={entry.educational_plan_entry}
+            >
               {entry.subject_name} ({entry.lesson_type})
             </option>
           ))}
@@ -294,7 +296,7 @@ function BrigadeAssignmentForm() {
           Отмена
         </button>
       </div>
-    </div>
+    </form>
   );
 }
 
@@ -1,9 +1,18 @@
 import React, { useState, useEffect } from "react";
-import axios from "axios";
 import { toast } from "react-toastify";
-import { API_BASE_URL } from "../../services/api";
+import {
+  autocompleteTeachers,
+  getTeachersAvailability,
+} from "../../services/api";
 
-function AddLessonForm({ date, plan, onCancel, onAdd, busyTeachers = [] }) {
+function AddLessonForm({
+  date,
+  groupId,
+  plan,
+  onCancel,
+  onAdd,
+  busyTeachers = [],
+}) {
   const [lessonType, setLessonType] = useState("");
   const [teacherQuery, setTeacherQuery] = useState("");
   const [teacherSuggestions, setTeacherSuggestions] = useState([]);
@@ -16,21 +25,30 @@ function AddLessonForm({ date, plan, onCancel, onAdd, busyTeachers = [] }) {
       setSelectedTeacher(null);
       return;
     }
-    axios
-      .get(
-        `${API_BASE_URL}teachers/?search=${encodeURIComponent(teacherQuery)}`,
-      )
+    autocompleteTeachers(teacherQuery)
       .then((res) => {
-        const suggestions = res.data.filter(
-          (t) => !busyTeachers.includes(t.id),
+        const candidates = res.data
+          .filter((t) => !busyTeachers.includes(t.id))
+          .map((t) => ({ id: t.id, shortname: t.label }));
+        if (candidates.length === 0) {
+          return [];
+        }
+        return getTeachersAvailability(
+          candidates.map((t) => t.id),
+          [date],
+          groupId,
+        ).then((availability) =>
+          candidates.filter(
+            (t) => availability.data.teachers[t.id] === "1",
+          ),
         );
-        setTeacherSuggestions(suggestions);
       })
+      .then((suggestions) => setTeacherSuggestions(suggestions))
       .catch((err) => {
         console.error(err);
         toast.error("Ошибка при поиске преподавателей.");
       });
-  }, [teacherQuery, busyTeachers]);
+  }, [teacherQuery, busyTeachers, date, groupId]);
 
   const handleSelectTeacher = (t) => {
     setSelectedTeacher(t);
@@ -54,13 +72,9 @@ function AddLessonForm({ date, plan, onCancel, onAdd, busyTeachers = [] }) {
 
     setIsChecking(true);
 
-    axios
-      .get(
-        `${API_BASE_URL}teacher_unavailable_dates?teacher_id=${selectedTeacher.id}`,
-      )
+    getTeachersAvailability([selectedTeacher.id], [date], groupId)
       .then((res) => {
-        const unavailable = res.data[0];
-        if (unavailable && unavailable.dates.includes(date)) {
+        if (res.data.teachers[selectedTeacher.id] !== "1") {
           toast.error("Преподаватель недоступен в эту дату");
         } else {
           onAdd({ lessonType, teacher: selectedTeacher, date });
@@ -111,7 +125,7 @@ function AddLessonForm({ date, plan, onCancel, onAdd, busyTeachers = [] }) {
                 style={{ cursor: "pointer" }}
                 onMouseDown={() => handleSelectTeacher(t)}
               >
-                {t.surname} {t.name} {t.lastname} ({t.shortname})
+                {t.shortname}
               </li>
             ))}
           </ul>
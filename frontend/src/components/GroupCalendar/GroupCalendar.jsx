@@ -33,11 +33,24 @@ function GroupCalendar() {
       axios.get(
         `${API_BASE_URL}educational_plans/remaining?group_id=${groupId}`,
       ),
+      axios.get(`${API_BASE_URL}schedule/?group_id=${groupId}`),
     ])
-      .then(([groupRes, datesRes, planRes]) => {
+      .then(([groupRes, datesRes, planRes, lessonsRes]) => {
         setGroupName(groupRes.data.name);
         setAvailableDates(datesRes.data.dates || []);
         setPlan(planRes.data);
+        const saved = {};
+        lessonsRes.data.forEach((lesson) => {
+          saved[lesson.date] = saved[lesson.date] || [];
+          saved[lesson.date].push({
+            teacher_id: lesson.teacher,
+            teacher_name: lesson.teacher_name,
+            lessonType: lesson.lesson_type,
+            educational_plan_entry: lesson.educational_plan_entry,
+            brigade_number: lesson.brigade_number,
+          });
+        });
+        setSchedule(saved);
       })
       .catch((err) => {
         console.error(err);
@@ -77,20 +90,23 @@ function GroupCalendar() {
   };
 
   const handleSaveAll = () => {
-    const requests = [];
+    const lessons = [];
     for (const date in schedule) {
       schedule[date].forEach((lesson) => {
-        requests.push(
-          axios.post(`${API_BASE_URL}schedule/`, {
-            group_id: Number(groupId),
-            date,
-            teacher_id: lesson.teacher_id,
-            lessonType: lesson.lessonType,
-          }),
-        );
+        lessons.push({
+          date,
+          teacher_id: lesson.teacher_id,
+          lesson_type: lesson.lessonType,
+          educational_plan_entry: lesson.educational_plan_entry || null,
+          brigade_number: lesson.brigade_number || null,
+        });
       });
     }
-    Promise.all(requests)
+    axios
+      .post(`${API_BASE_URL}schedule/bulk/`, {
+        group_id: Number(groupId),
+        lessons,
+      })
       .then(() => {
         toast.success("Расписание сохранено!");
         navigate("/group_calendar");
@@ -139,6 +155,7 @@ function GroupCalendar() {
                     {activeDate === d ? (
                       <AddLessonForm
                         date={d}
+                        groupId={Number(groupId)}
                         plan={plan}
                         onAdd={handleAddLesson}
                         onCancel={() => setActiveDate(null)}
@@ -14,30 +14,15 @@ function GroupCalendarList() {
   useEffect(() => {
     setLoading(true);
     axios
-      .get(`${API_BASE_URL}groups/`)
+      .get(`${API_BASE_URL}educational_plans/remaining/all`)
       .then((res) => {
-        setGroups(res.data);
-        return res.data;
-      })
-      .then((groupsData) => {
-        const requests = groupsData.map((g) =>
-          axios
-            .get(`${API_BASE_URL}educational_plans/remaining?group_id=${g.id}`)
-            .then((resp) => ({
-              groupId: g.id,
-              data: resp.data,
-            }))
-            .catch(() => null),
-        );
-        return Promise.all(requests);
-      })
-      .then((arr) => {
         const loadObj = {};
-        arr.forEach((item) => {
-          if (item) {
-            loadObj[item.groupId] = item.data;
-          }
+        res.data.forEach((item) => {
+          loadObj[item.group_id] = item;
         });
+        setGroups(
+          res.data.map((item) => ({ id: item.group_id, name: item.group_name })),
+        );
         setLoads(loadObj);
       })
       .catch((err) => {
@@ -62,11 +47,8 @@ function GroupCalendarList() {
 
       <div className="row">
         {groups.map((g) => {
-          const loadInfo = loads[g.id] || { УП: 0, КЛ: 0, ДК: 0 };
-          const isCalendarAvailable =
-            loadInfo["УП"] !== 0 ||
-            loadInfo["КЛ"] !== 0 ||
-            loadInfo["ДК"] !== 0;
+          const loadInfo = loads[g.id] || { УП: 0, КЛ: 0, ДК: 0, planned: 0 };
+          const isCalendarAvailable = loadInfo.planned > 0;
           return (
             <div key={g.id} className="col-md-4">
               <div className="card mb-3">
@@ -0,0 +1,32 @@
+import React, { useEffect, useState } from "react";
+import { getCalendarLink } from "../../services/api";
+
+function CalendarLink({ kind, id }) {
+  const [url, setUrl] = useState("");
+
+  useEffect(() => {
+    setUrl("");
+    if (!id) return;
+    getCalendarLink(kind, id)
+      .then((response) => setUrl(response.data.url))
+      .catch((error) =>
+        console.error("Ошибка при получении ссылки на календарь:", error),
+      );
+  }, [kind, id]);
+
+  if (!url) return null;
+
+  return (
+    <div className="mt-2">
+      <a
+        className="btn btn-outline-secondary btn-sm"
+        href={url.replace(/^https?:/, "webcal:")}
+      >
+        Подписаться в календаре
+      </a>
+      <input className="form-control form-control-sm mt-1" value={url} readOnly />
+    </div>
+  );
+}
+
+export default CalendarLink;
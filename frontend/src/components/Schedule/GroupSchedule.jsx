@@ -1,5 +1,6 @@
 import React, { useEffect, useState } from "react";
 import { getGroups, getLectures } from "../../services/api";
+import CalendarLink from "./CalendarLink";
 
 function GroupSchedule() {
   const [groups, setGroups] = useState([]);
@@ -48,6 +49,7 @@ function GroupSchedule() {
           </select>
         </div>
       </form>
+      <CalendarLink kind="group" id={selectedGroup} />
       <table className="table mt-3">
         <thead>
           <tr>
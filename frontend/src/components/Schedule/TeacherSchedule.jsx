@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { getTeachers } from "../../services/api";
+import CalendarLink from "./CalendarLink";
 
 function TeacherSchedule() {
   const [teachers, setTeachers] = useState([]);
@@ -53,6 +54,7 @@ function TeacherSchedule() {
           </select>
         </div>
       </form>
+      <CalendarLink kind="teacher" id={selectedTeacher} />
     </div>
   );
 }
@@ -1,6 +1,6 @@
 import { useState } from "react";
 import { useNavigate } from "react-router-dom";
-import { uploadTeachers } from "../../services/api";
+import { getJob, uploadTeachers } from "../../services/api";
 import { toast } from "react-toastify";
 
 function TeacherUpload() {
@@ -9,8 +9,34 @@ function TeacherUpload() {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
   const [uploaded, setUploaded] = useState(false);
+  const [progress, setProgress] = useState(0);
   const navigate = useNavigate();
 
+  const failUpload = (error) => {
+    setLoading(false);
+    setError("Ошибка при загрузке файла. Пожалуйста, попробуйте снова.");
+    console.error("Ошибка при загрузке преподавателей:", error);
+    toast.error("Ошибка при загрузке файла. Пожалуйста, попробуйте снова.");
+  };
+
+  const waitForJob = (jobId) => {
+    getJob(jobId)
+      .then((response) => {
+        const job = response.data;
+        setProgress(job.progress);
+        if (job.state === "done") {
+          setLoading(false);
+          setUploaded(true);
+          toast.success("Импорт преподавателей завершён!");
+        } else if (job.state === "failed") {
+          failUpload(job.error);
+        } else {
+          setTimeout(() => waitForJob(jobId), 1000);
+        }
+      })
+      .catch(failUpload);
+  };
+
   const handleSubmit = (event) => {
     event.preventDefault();
     if (!file) {
@@ -24,18 +50,10 @@ function TeacherUpload() {
     formData.append("file", file);
     formData.append("employer_type", employer_type);
 
+    setProgress(0);
     uploadTeachers(formData)
-      .then(() => {
-        setLoading(false);
-        setUploaded(true);
-        toast.success("Импорт преподавателей завершён!");
-      })
-      .catch((error) => {
-        setLoading(false);
-        setError("Ошибка при загрузке файла. Пожалуйста, попробуйте снова.");
-        console.error("Ошибка при загрузке преподавателей:", error);
-        toast.error("Ошибка при загрузке файла. Пожалуйста, попробуйте снова.");
-      });
+      .then((response) => waitForJob(response.data.job_id))
+      .catch(failUpload);
   };
 
   const handleConfirm = () => {
@@ -88,7 +106,7 @@ function TeacherUpload() {
             </select>
           </div>
           <button type="submit" className="btn btn-primary" disabled={loading}>
-            {loading ? "Загрузка..." : "Загрузить"}
+            {loading ? `Загрузка... ${progress}%` : "Загрузить"}
           </button>
           <button
             type="button"
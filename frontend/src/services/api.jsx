@@ -46,6 +46,8 @@ export const uploadTeachers = (formData) =>
     },
   });
 
+export const getJob = (id) => axios.get(`${API_BASE_URL}jobs/${id}/`);
+
 export const getTeachers = () => axios.get(`${API_BASE_URL}teachers/`);
 export const getTeacherById = (id) => axios.get(`${API_BASE_URL}teachers/${id}/`);
 export const createTeacher = (data) => axios.post(`${API_BASE_URL}teachers/`, data);
@@ -57,6 +59,11 @@ export const searchTeachers = (query) =>
     .get(`${API_BASE_URL}teachers/?search=${encodeURIComponent(query)}`)
     .then((res) => res.data);
 
+export const autocompleteTeachers = (query, limit = 10) =>
+  axios.get(`${API_BASE_URL}autocomplete/`, {
+    params: { kind: "teacher", q: query, limit },
+  });
+
 export const getTeacherUnavailableDates = (teacherId) => {
   return axios.get(`${API_BASE_URL}teacher_unavailable_dates/?teacher_id=${teacherId}`);
 };
@@ -69,6 +76,15 @@ export const updateTeacherUnavailableDates = (id, teacherId, dates) => {
   return axios.put(`${API_BASE_URL}teacher_unavailable_dates/${id}/`, { teacher_id: teacherId, dates });
 };
 
+export const getTeachersAvailability = (teacherIds, dates, groupId) =>
+  axios.get(`${API_BASE_URL}teacher_unavailable_dates/availability/`, {
+    params: {
+      teacher_ids: teacherIds.join(","),
+      dates: dates.join(","),
+      ...(groupId ? { group_id: groupId } : {}),
+    },
+  });
+
 // Профили преподавателей
 export const getTeacherProfiles = () => axios.get(`${API_BASE_URL}teacher_profiles/`);
 export const createTeacherProfile = (data) => axios.post(`${API_BASE_URL}teacher_profiles/`, data);
@@ -85,6 +101,8 @@ export const deleteGroup = (id) => axios.delete(`${API_BASE_URL}groups/${id}/`);
 
 export const createLecture = (data) => axios.post(`${API_BASE_URL}lectures/`, data);
 export const getLectures = (params) => axios.get(`${API_BASE_URL}lectures/`, { params });
+export const getCalendarLink = (kind, id) =>
+  axios.get(`${API_BASE_URL}schedule/calendar/`, { params: { kind, id } });
 
 // Предметы
 export const getSubjects = () => axios.get(`${API_BASE_URL}subjects/`);
@@ -110,7 +128,12 @@ export const updateGroupEducationalPlan = (id, data) => axios.put(`${API_BASE_UR
 export const deleteGroupEducationalPlan = (id) => axios.delete(`${API_BASE_URL}group_educational_plans/${id}/`);
 export const searchGroupEducationalPlans = (query) =>
   axios
-    .get(`${API_BASE_URL}group_educational_plans/?search=${encodeURIComponent(query)}`)
+    .get(`${API_BASE_URL}group_educational_plans/`, {
+      params: {
+        search: query,
+        fields: "id,group_name,educational_plan,educational_plan_name",
+      },
+    })
     .then((res) => res.data);
 
 // Записи учебного плана
@@ -119,14 +142,14 @@ export const getEducationalPlanEntries = (planId) =>
 
 // Назначения бригад
 export const getBrigadeAssignments = () => axios.get(`${API_BASE_URL}brigade_assignments/`);
-export const getBrigadeAssignmentsBulk = (groupId, planEntryId) =>
-  axios.get(
-    `${API_BASE_URL}brigade_assignments/bulk_get/?group_educational_plan=${groupId}&educational_plan_entry=${planEntryId}`,
-  );
-export const bulkUpdateBrigadeAssignments = (data) =>
-  axios.post(`${API_BASE_URL}brigade_assignments/bulk_update/`, data);
 export const bulkDeleteBrigadeAssignments = (data) =>
   axios.post(`${API_BASE_URL}brigade_assignments/bulk_delete/`, data);
+export const getBrigadeMatrix = (groupPlanId) =>
+  axios.get(
+    `${API_BASE_URL}brigade_assignments/matrix/?group_educational_plan=${groupPlanId}`,
+  );
+export const saveBrigadeMatrix = (data) =>
+  axios.post(`${API_BASE_URL}brigade_assignments/matrix/`, data);
 
 // Профиль пользователя
 export const getUserProfile = () => axios.get(`${API_BASE_URL}user/profile/`);
@@ -13,9 +13,21 @@ echo "Postgres is ready"
 echo "Generating migrations..."
 python manage.py makemigrations --noinput
 
+echo "Removing duplicates before unique constraints..."
+python manage.py dedupe_unique_rows
+
 echo "Applying migrations..."
 python manage.py migrate --noinput
 
+echo "Syncing group and teacher dates..."
+python manage.py sync_available_days
+
+echo "Rebuilding group plan hours..."
+python manage.py rebuild_plan_hours
+
+echo "Rebuilding teacher workload..."
+python manage.py rebuild_workload
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
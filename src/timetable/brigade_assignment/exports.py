@@ -0,0 +1,90 @@
+from itertools import groupby
+
+from django.db.models import F
+
+from educational_plan.models import EducationalPlanEntry
+
+from timetable.xlsx import write_table
+
+from .models import BrigadeAssignment
+
+NUMBERS = [number for number, _ in BrigadeAssignment.BRIGADE_CHOICES]
+COLUMNS = [
+    ("Группа", 16),
+    ("Учебный план", 32),
+    ("Дисциплина", 40),
+    ("Вид занятия", 24),
+    ("Часы", 8),
+    *((label, 24) for _, label in BrigadeAssignment.BRIGADE_CHOICES),
+]
+
+
+def matrix_rows(group_plans, chunk_size=2000):
+    """
+    Строка на запись плана каждой привязки плана к группе.
+
+    Записи планов и назначения бригад читаются двумя потоками в одном и
+    том же порядке и сливаются по ``(привязка, запись плана)``.
+    """
+    types = dict(EducationalPlanEntry.LESSON_TYPE_CHOICES)
+    entries = group_plans.order_by(
+        "group__name",
+        "id",
+        "educational_plan__entries__subject__name",
+        "educational_plan__entries__lesson_type",
+        "educational_plan__entries__id",
+    ).values_list(
+        "id",
+        "educational_plan__entries__id",
+        "group__name",
+        "educational_plan__name",
+        "educational_plan__entries__subject__name",
+        "educational_plan__entries__lesson_type",
+        "educational_plan__entries__hours",
+    )
+    assignments = (
+        BrigadeAssignment.objects.filter(
+            group_educational_plan__in=group_plans,
+            educational_plan_entry__educational_plan=F(
+                "group_educational_plan__educational_plan"
+            ),
+        )
+        .order_by(
+            "group_educational_plan__group__name",
+            "group_educational_plan_id",
+            "educational_plan_entry__subject__name",
+            "educational_plan_entry__lesson_type",
+            "educational_plan_entry_id",
+            "brigade_number",
+        )
+        .values_list(
+            "group_educational_plan_id",
+            "educational_plan_entry_id",
+            "brigade_number",
+            "teacher__shortname",
+        )
+    )
+    cells = groupby(
+        assignments.iterator(chunk_size=chunk_size), key=lambda row: row[:2]
+    )
+    pending = next(cells, None)
+    for row in entries.iterator(chunk_size=chunk_size):
+        key, (group, plan, subject, lesson_type, hours) = row[:2], row[2:]
+        if key[1] is None:
+            continue
+        teachers = {}
+        if pending is not None and pending[0] == key:
+            teachers = {number: name for _, _, number, name in pending[1]}
+            pending = next(cells, None)
+        yield [
+            group,
+            plan,
+            subject,
+            types.get(lesson_type, lesson_type),
+            hours,
+            *(teachers.get(number) for number in NUMBERS),
+        ]
+
+
+def write_matrix(file, group_plans):
+    write_table(file, "Бригады", COLUMNS, matrix_rows(group_plans))
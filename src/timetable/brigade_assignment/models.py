@@ -22,6 +22,21 @@ class BrigadeAssignment(models.Model):
     brigade_number = models.PositiveSmallIntegerField(choices=BRIGADE_CHOICES)
     teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "group_educational_plan",
+                    "educational_plan_entry",
+                    "brigade_number",
+                ],
+                name="unique_brigade_assignment",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["teacher", "educational_plan_entry"]),
+        ]
+
     def __str__(self):
         return (
             f"{self.group_educational_plan.group.name} - "
@@ -1,13 +1,23 @@
+from django.db import transaction
+
 from educational_plan.models import EducationalPlanEntry
 
 from group_educational_plan.models import GroupEducationalPlan
 
 from rest_framework import serializers
 
+from teacher.models import Teacher
+
+from teacher_profile.workload import refresh_on_commit
+
+from timetable.sparse import SparseFieldsSerializerMixin
+
 from .models import BrigadeAssignment
 
 
-class BrigadeAssignmentSerializer(serializers.ModelSerializer):
+class BrigadeAssignmentSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     group_name = serializers.CharField(
         source="group_educational_plan.group.name", read_only=True
     )
@@ -27,8 +37,8 @@ class BrigadeAssignmentSerializer(serializers.ModelSerializer):
 
     def get_composite_id(self, obj):
         return (
-            f"{obj.group_educational_plan.id}-"
-            f"{obj.educational_plan_entry.id}-{obj.brigade_number}"
+            f"{obj.group_educational_plan_id}-"
+            f"{obj.educational_plan_entry_id}-{obj.brigade_number}"
         )
 
     class Meta:
@@ -46,6 +56,13 @@ class BrigadeAssignmentSerializer(serializers.ModelSerializer):
             "teacher",
             "teacher_name",
         ]
+        sparse_sources = {
+            "composite_id": [
+                "group_educational_plan",
+                "educational_plan_entry",
+                "brigade_number",
+            ],
+        }
 
 
 class BrigadeAssignmentBulkSerializer(serializers.Serializer):
@@ -68,3 +85,138 @@ class BrigadeAssignmentBulkSerializer(serializers.Serializer):
                 "Некорректный ID записи учебного плана."
             )
         return value
+
+
+class BrigadeSlotSerializer(serializers.Serializer):
+    brigade_number = serializers.ChoiceField(
+        choices=BrigadeAssignment.BRIGADE_CHOICES
+    )
+    teacher = serializers.IntegerField(allow_null=True, required=False)
+
+
+class BrigadeMatrixRowSerializer(serializers.Serializer):
+    educational_plan_entry = serializers.IntegerField()
+    brigades = BrigadeSlotSerializer(many=True)
+
+
+class BrigadeMatrixSerializer(serializers.Serializer):
+    """
+    Полная матрица «записи плана × бригады» для привязки плана к группе.
+
+    Назначения, которых нет в матрице, удаляются; бригада без
+    преподавателя означает отсутствие назначения.
+    """
+
+    group_educational_plan = serializers.PrimaryKeyRelatedField(
+        queryset=GroupEducationalPlan.objects.all()
+    )
+    entries = BrigadeMatrixRowSerializer(many=True)
+
+    def validate(self, attrs):
+        group_plan = attrs["group_educational_plan"]
+        rows = attrs["entries"]
+        known_entries = set(
+            EducationalPlanEntry.objects.filter(
+                educational_plan_id=group_plan.educational_plan_id,
+                id__in={row["educational_plan_entry"] for row in rows},
+            ).values_list("id", flat=True)
+        )
+        known_teachers = set(
+            Teacher.objects.filter(
+                id__in={
+                    slot["teacher"]
+                    for row in rows
+                    for slot in row["brigades"]
+                    if slot.get("teacher")
+                }
+            ).values_list("id", flat=True)
+        )
+
+        errors = [
+            self._row_errors(row, known_entries, known_teachers)
+            for row in rows
+        ]
+        if any(errors):
+            raise serializers.ValidationError({"entries": errors})
+
+        attrs["matrix"] = {
+            (row["educational_plan_entry"], slot["brigade_number"]): slot[
+                "teacher"
+            ]
+            for row in rows
+            for slot in row["brigades"]
+            if slot.get("teacher")
+        }
+        return attrs
+
+    @staticmethod
+    def _row_errors(row, known_entries, known_teachers):
+        errors = {}
+        if row["educational_plan_entry"] not in known_entries:
+            errors["educational_plan_entry"] = (
+                "Запись не относится к учебному плану группы."
+            )
+        for slot in row["brigades"]:
+            teacher_id = slot.get("teacher")
+            if teacher_id and teacher_id not in known_teachers:
+                errors["brigades"] = (
+                    f"Некорректный ID преподавателя: {teacher_id}"
+                )
+                break
+        return errors
+
+    def create(self, validated_data):
+        group_plan = validated_data["group_educational_plan"]
+        matrix = validated_data["matrix"]
+
+        existing = {}
+        to_delete = []
+        for assignment in BrigadeAssignment.objects.filter(
+            group_educational_plan=group_plan
+        ):
+            key = (
+                assignment.educational_plan_entry_id,
+                assignment.brigade_number,
+            )
+            if key in existing or key not in matrix:
+                to_delete.append(assignment.id)
+            else:
+                existing[key] = assignment
+
+        to_update = []
+        replaced = set()
+        for key, assignment in existing.items():
+            if assignment.teacher_id != matrix[key]:
+                replaced.add(assignment.teacher_id)
+                assignment.teacher_id = matrix[key]
+                to_update.append(assignment)
+        to_create = [
+            BrigadeAssignment(
+                group_educational_plan=group_plan,
+                educational_plan_entry_id=entry_id,
+                brigade_number=brigade_number,
+                teacher_id=teacher_id,
+            )
+            for (entry_id, brigade_number), teacher_id in matrix.items()
+            if (entry_id, brigade_number) not in existing
+        ]
+
+        with transaction.atomic():
+            if to_delete:
+                BrigadeAssignment.objects.filter(id__in=to_delete).delete()
+            BrigadeAssignment.objects.bulk_update(to_update, ["teacher"])
+            BrigadeAssignment.objects.bulk_create(
+                to_create,
+                update_conflicts=True,
+                unique_fields=[
+                    "group_educational_plan",
+                    "educational_plan_entry",
+                    "brigade_number",
+                ],
+                update_fields=["teacher"],
+            )
+            refresh_on_commit(
+                replaced,
+                {a.educational_plan_entry_id for a in to_update + to_create},
+            )
+        return group_plan
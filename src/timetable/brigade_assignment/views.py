@@ -1,22 +1,36 @@
+from collections import defaultdict
+
+from django.db import transaction
+
 from educational_plan.models import EducationalPlanEntry
 
 from group_educational_plan.models import GroupEducationalPlan
 
-from rest_framework import filters, status, viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from teacher.models import Teacher
 
+from teacher_profile.workload import refresh_on_commit
 
+from timetable.search import RankedSearchFilter
+from timetable.sparse import SparseFieldsViewSetMixin
+from timetable.streaming import StreamingListMixin
+from timetable.xlsx import xlsx_response
+
+from .exports import write_matrix
 from .models import BrigadeAssignment
 from .serializers import (
     BrigadeAssignmentBulkSerializer,
     BrigadeAssignmentSerializer,
+    BrigadeMatrixSerializer,
 )
 
 
-class BrigadeAssignmentViewSet(viewsets.ModelViewSet):
+class BrigadeAssignmentViewSet(
+    SparseFieldsViewSetMixin, StreamingListMixin, viewsets.ModelViewSet
+):
     queryset = BrigadeAssignment.objects.select_related(
         "group_educational_plan__group",
         "group_educational_plan__educational_plan",
@@ -24,7 +38,7 @@ class BrigadeAssignmentViewSet(viewsets.ModelViewSet):
         "teacher",
     ).all()
     serializer_class = BrigadeAssignmentSerializer
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [RankedSearchFilter]
     search_fields = [
         "group_educational_plan__group__name",
         "group_educational_plan__educational_plan__name",
@@ -38,36 +52,64 @@ class BrigadeAssignmentViewSet(viewsets.ModelViewSet):
         bulk_serializer.is_valid(raise_exception=True)
         data = bulk_serializer.validated_data
 
-        group_plan = GroupEducationalPlan.objects.get(
-            id=data["group_educational_plan"]
-        )
-        plan_entry = EducationalPlanEntry.objects.get(
-            id=data["educational_plan_entry"]
+        group_plan_id = data["group_educational_plan"]
+        plan_entry_id = data["educational_plan_entry"]
+        brigades = {
+            brigade.get("brigade_number"): brigade["teacher"]
+            for brigade in data["brigades"]
+            if brigade.get("teacher")
+        }
+        error = self.check_teachers(brigades.values())
+        if error is not None:
+            return error
+
+        assignments = self.get_queryset().filter(
+            group_educational_plan_id=group_plan_id,
+            educational_plan_entry_id=plan_entry_id,
+            brigade_number__in=brigades,
         )
-        brigades_data = data["brigades"]
-
-        created = []
-        for brigade in brigades_data:
-            brigade_number = brigade.get("brigade_number")
-            teacher_id = brigade.get("teacher")
-            if not teacher_id:
-                continue
-            teacher = Teacher.objects.filter(id=teacher_id).first()
-            if not teacher:
+        with transaction.atomic():
+            # Прежние преподаватели бригад нужны только для пересчёта
+            # их нагрузки; дубли исключает уникальное ограничение.
+            replaced = set(assignments.values_list("teacher_id", flat=True))
+            self.upsert(group_plan_id, plan_entry_id, brigades)
+            refresh_on_commit(replaced, [plan_entry_id])
+
+        read_serializer = BrigadeAssignmentSerializer(assignments, many=True)
+        return Response(read_serializer.data, status=status.HTTP_201_CREATED)
+
+    @staticmethod
+    def check_teachers(teacher_ids):
+        """Ответ 400 для первого несуществующего преподавателя."""
+        known = Teacher.objects.in_bulk(set(teacher_ids))
+        for teacher_id in teacher_ids:
+            if teacher_id not in known:
                 return Response(
                     {"error": f"Некорректный ID преподавателя: {teacher_id}"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            assignment = BrigadeAssignment.objects.create(
-                group_educational_plan=group_plan,
-                educational_plan_entry=plan_entry,
-                brigade_number=brigade_number,
-                teacher=teacher,
-            )
-            created.append(assignment)
+        return None
 
-        read_serializer = BrigadeAssignmentSerializer(created, many=True)
-        return Response(read_serializer.data, status=status.HTTP_201_CREATED)
+    @staticmethod
+    def upsert(group_plan_id, plan_entry_id, brigades):
+        BrigadeAssignment.objects.bulk_create(
+            [
+                BrigadeAssignment(
+                    group_educational_plan_id=group_plan_id,
+                    educational_plan_entry_id=plan_entry_id,
+                    brigade_number=brigade_number,
+                    teacher_id=teacher_id,
+                )
+                for brigade_number, teacher_id in brigades.items()
+            ],
+            update_conflicts=True,
+            unique_fields=[
+                "group_educational_plan",
+                "educational_plan_entry",
+                "brigade_number",
+            ],
+            update_fields=["teacher"],
+        )
 
     @action(detail=False, methods=["get"])
     def bulk_get(self, request):
@@ -81,7 +123,7 @@ class BrigadeAssignmentViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        assignments = BrigadeAssignment.objects.filter(
+        assignments = self.get_queryset().filter(
             group_educational_plan=group_plan_id,
             educational_plan_entry=plan_entry_id,
         )
@@ -94,66 +136,137 @@ class BrigadeAssignmentViewSet(viewsets.ModelViewSet):
         bulk_serializer.is_valid(raise_exception=True)
         data = bulk_serializer.validated_data
 
-        group_plan = GroupEducationalPlan.objects.get(
-            id=data["group_educational_plan"]
-        )
-        plan_entry = EducationalPlanEntry.objects.get(
-            id=data["educational_plan_entry"]
-        )
-        requested_brigades = {
-            item["brigade_number"]: item.get("teacher")
+        group_plan_id = data["group_educational_plan"]
+        plan_entry_id = data["educational_plan_entry"]
+        # Бригада без преподавателя или не переданная бригада снимается.
+        brigades = {
+            item["brigade_number"]: item["teacher"]
             for item in data["brigades"]
-            if "brigade_number" in item
+            if "brigade_number" in item and item.get("teacher")
         }
+        error = self.check_teachers(brigades.values())
+        if error is not None:
+            return error
 
-        existing = BrigadeAssignment.objects.filter(
-            group_educational_plan=group_plan,
-            educational_plan_entry=plan_entry,
+        assignments = BrigadeAssignment.objects.filter(
+            group_educational_plan_id=group_plan_id,
+            educational_plan_entry_id=plan_entry_id,
         )
-        for assignment in existing:
-            bn = assignment.brigade_number
-            if bn not in requested_brigades or not requested_brigades[bn]:
-                assignment.delete()
-            else:
-                new_teacher_id = requested_brigades[bn]
-                if assignment.teacher_id != new_teacher_id:
-                    teacher = Teacher.objects.filter(id=new_teacher_id).first()
-                    if not teacher:
-                        return Response(
-                            {
-                                "error": f"Некорректный ID преподавателя: "
-                                f"{new_teacher_id}"
-                            },
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-                    assignment.teacher = teacher
-                    assignment.save()
-            requested_brigades.pop(bn, None)
-
-        for bn, teacher_id in requested_brigades.items():
-            if teacher_id:
-                teacher = Teacher.objects.filter(id=teacher_id).first()
-                if not teacher:
-                    return Response(
-                        {
-                            "error": f"Некорректный ID преподавателя: "
-                            f"{teacher_id}"
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-                BrigadeAssignment.objects.create(
-                    group_educational_plan=group_plan,
-                    educational_plan_entry=plan_entry,
-                    brigade_number=bn,
-                    teacher=teacher,
-                )
-        updated = BrigadeAssignment.objects.filter(
-            group_educational_plan=group_plan,
-            educational_plan_entry=plan_entry,
+        with transaction.atomic():
+            replaced = set(assignments.values_list("teacher_id", flat=True))
+            assignments.exclude(brigade_number__in=brigades).delete()
+            self.upsert(group_plan_id, plan_entry_id, brigades)
+            refresh_on_commit(replaced, [plan_entry_id])
+
+        updated = self.get_queryset().filter(
+            group_educational_plan_id=group_plan_id,
+            educational_plan_entry_id=plan_entry_id,
         )
         serializer = BrigadeAssignmentSerializer(updated, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["get"])
+    def matrix(self, request):
+        group_plan_id = request.query_params.get("group_educational_plan")
+        if not group_plan_id:
+            return Response(
+                {"error": "Параметр group_educational_plan обязателен."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not group_plan_id.isdigit():
+            return Response(
+                {"error": "Некорректный ID привязки плана."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        group_plan = (
+            GroupEducationalPlan.objects.select_related(
+                "group", "educational_plan"
+            )
+            .filter(id=group_plan_id)
+            .first()
+        )
+        if group_plan is None:
+            return Response(
+                {"error": "Привязка плана к группе не найдена."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(
+            self.matrix_data(group_plan), status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        group_plans = GroupEducationalPlan.objects.all()
+        group_plan_id = request.query_params.get("group_educational_plan")
+        if group_plan_id:
+            if not group_plan_id.isdigit():
+                return Response(
+                    {"error": "Некорректный ID привязки плана."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            group_plans = group_plans.filter(id=group_plan_id)
+        return xlsx_response(
+            lambda file: write_matrix(file, group_plans), "brigades.xlsx"
+        )
+
+    @matrix.mapping.post
+    def update_matrix(self, request):
+        serializer = BrigadeMatrixSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        group_plan = serializer.save()
+        return Response(
+            self.matrix_data(group_plan), status=status.HTTP_200_OK
+        )
+
+    @staticmethod
+    def matrix_data(group_plan):
+        cells = defaultdict(dict)
+        for assignment in BrigadeAssignment.objects.filter(
+            group_educational_plan=group_plan
+        ).select_related("teacher"):
+            cells[assignment.educational_plan_entry_id][
+                assignment.brigade_number
+            ] = assignment
+
+        rows = []
+        for entry in (
+            EducationalPlanEntry.objects.filter(
+                educational_plan_id=group_plan.educational_plan_id
+            )
+            .select_related("subject")
+            .order_by("subject__name", "lesson_type", "id")
+        ):
+            brigades = []
+            for number, _ in BrigadeAssignment.BRIGADE_CHOICES:
+                assignment = cells[entry.id].get(number)
+                cell = {
+                    "id": None,
+                    "brigade_number": number,
+                    "teacher": None,
+                    "teacher_name": None,
+                }
+                if assignment is not None:
+                    cell["id"] = assignment.id
+                    cell["teacher"] = assignment.teacher_id
+                    cell["teacher_name"] = assignment.teacher.shortname
+                brigades.append(cell)
+            rows.append(
+                {
+                    "educational_plan_entry": entry.id,
+                    "subject": entry.subject_id,
+                    "subject_name": entry.subject.name,
+                    "lesson_type": entry.lesson_type,
+                    "hours": entry.hours,
+                    "brigades": brigades,
+                }
+            )
+        return {
+            "group_educational_plan": group_plan.id,
+            "group_name": group_plan.group.name,
+            "educational_plan_name": group_plan.educational_plan.name,
+            "entries": rows,
+        }
+
     @action(detail=False, methods=["post"])
     def bulk_delete(self, request):
         group_plan_id = request.data.get("group_educational_plan")
@@ -1,4 +1,9 @@
+from collections import defaultdict
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Min, Q, Sum
+from django.db.models.functions import Coalesce, Upper
 
 from subject.models import Subject
 
@@ -9,10 +14,58 @@ class EducationalPlan(models.Model):
     practice_start_date = models.DateField(null=True, blank=True)
     practice_end_date = models.DateField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="plan_search_trgm_idx",
+            )
+        ]
+
     def __str__(self):
         return self.name
 
 
+class EducationalPlanEntryQuerySet(models.QuerySet):
+    def pivot_by_plan(self):
+        """
+        Часы по предметам и типам занятий, сгруппированные по планам:
+        ``{plan_id: [{"subject": id, "УП": 0, "КЛ": 0, "ДК": 0}, ...]}``.
+        Считается одним запросом с условной агрегацией.
+        """
+        aliases = {
+            lesson_type: f"hours_{i}"
+            for i, (lesson_type, _) in enumerate(
+                EducationalPlanEntry.LESSON_TYPE_CHOICES
+            )
+        }
+        rows = (
+            self.values("educational_plan_id", "subject_id")
+            .annotate(
+                first_id=Min("id"),
+                **{
+                    alias: Coalesce(
+                        Sum("hours", filter=Q(lesson_type=lesson_type)), 0
+                    )
+                    for lesson_type, alias in aliases.items()
+                },
+            )
+            .order_by("educational_plan_id", "first_id")
+        )
+        result = defaultdict(list)
+        for row in rows:
+            result[row["educational_plan_id"]].append(
+                {
+                    "subject": row["subject_id"],
+                    **{
+                        lesson_type: row[alias]
+                        for lesson_type, alias in aliases.items()
+                    },
+                }
+            )
+        return result
+
+
 class EducationalPlanEntry(models.Model):
     LESSON_TYPE_UP = "УП"
     LESSON_TYPE_KL = "КЛ"
@@ -30,5 +83,7 @@ class EducationalPlanEntry(models.Model):
     lesson_type = models.CharField(max_length=2, choices=LESSON_TYPE_CHOICES)
     hours = models.IntegerField(default=0)
 
+    objects = EducationalPlanEntryQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.subject} – {self.lesson_type} – {self.hours} ч."
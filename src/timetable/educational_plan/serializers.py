@@ -1,11 +1,22 @@
+from django.db import transaction
+
+from group_educational_plan.counters import refresh_plan_hours
+
 from rest_framework import serializers
 
 from subject.models import Subject
 
+from teacher_profile.workload import refresh_on_commit
+
+from timetable.sparse import SparseFieldsSerializerMixin
+from timetable.versions import bump
+
 from .models import EducationalPlan, EducationalPlanEntry
 
 
-class EducationalPlanEntrySerializer(serializers.ModelSerializer):
+class EducationalPlanEntrySerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     subject_name = serializers.CharField(source="subject.name", read_only=True)
     lesson_type_name = serializers.CharField(
         source="lesson_type.short_name", read_only=True
@@ -23,7 +34,20 @@ class EducationalPlanEntrySerializer(serializers.ModelSerializer):
         ]
 
 
-class EducationalPlanSerializer(serializers.ModelSerializer):
+class EducationalPlanListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        plans = list(data.all() if hasattr(data, "all") else data)
+        if "entries" not in self.child.fields:
+            return super().to_representation(plans)
+        self.child.entries_by_plan = EducationalPlanEntry.objects.filter(
+            educational_plan__in=plans
+        ).pivot_by_plan()
+        return super().to_representation(plans)
+
+
+class EducationalPlanSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     entries = serializers.SerializerMethodField()
 
     practice_start_date = serializers.DateField(
@@ -41,22 +65,14 @@ class EducationalPlanSerializer(serializers.ModelSerializer):
             "practice_end_date",
             "entries",
         ]
+        list_serializer_class = EducationalPlanListSerializer
+        sparse_sources = {"entries": []}
 
     def get_entries(self, obj):
-        grouped = {}
-        for entry in obj.entries.all():
-            subj_id = entry.subject.id
-            if subj_id not in grouped:
-                grouped[subj_id] = {
-                    "subject": subj_id,
-                    "УП": 0,
-                    "КЛ": 0,
-                    "ДК": 0,
-                }
-            lt_name = entry.lesson_type
-            if lt_name in grouped[subj_id]:
-                grouped[subj_id][lt_name] = entry.hours
-        return list(grouped.values())
+        entries_by_plan = getattr(self, "entries_by_plan", None)
+        if entries_by_plan is None:
+            entries_by_plan = obj.entries.pivot_by_plan()
+        return entries_by_plan.get(obj.id, [])
 
     def to_internal_value(self, data):
         internal = super().to_internal_value(data)
@@ -77,8 +93,9 @@ class EducationalPlanSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         entries_data = validated_data.pop("entries", [])
-        educational_plan = EducationalPlan.objects.create(**validated_data)
-        self.handle_plan_entries(educational_plan, entries_data)
+        with transaction.atomic():
+            educational_plan = EducationalPlan.objects.create(**validated_data)
+            self.handle_plan_entries(educational_plan, entries_data)
         return educational_plan
 
     def update(self, instance, validated_data):
@@ -93,30 +110,72 @@ class EducationalPlanSerializer(serializers.ModelSerializer):
         instance.practice_end_date = validated_data.get(
             "practice_end_date", instance.practice_end_date
         )
-        instance.save()
-        self.handle_plan_entries(instance, entries_data)
+        with transaction.atomic():
+            instance.save()
+            self.handle_plan_entries(instance, entries_data)
         return instance
 
-    def handle_plan_entries(self, educational_plan, entries_data):
-        EducationalPlanEntry.objects.filter(
-            educational_plan=educational_plan
-        ).delete()
-        lesson_type_keys = ["УП", "КЛ", "ДК"]
+    @staticmethod
+    def _to_int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def parse_plan_entries(self, entries_data):
+        lesson_type_keys = [
+            lt_name for lt_name, _ in EducationalPlanEntry.LESSON_TYPE_CHOICES
+        ]
+        subjects = Subject.objects.in_bulk(
+            {self._to_int(entry.get("subject")) for entry in entries_data}
+            - {None}
+        )
 
+        hours_by_key = {}
         for entry in entries_data:
-            subject_id = entry.get("subject")
-            if not subject_id:
-                continue
-            try:
-                subject = Subject.objects.get(id=subject_id)
-            except Subject.DoesNotExist:
+            subject = subjects.get(self._to_int(entry.get("subject")))
+            if subject is None:
                 continue
             for lt_name in lesson_type_keys:
-                hours = entry.get(lt_name, 0)
+                hours = self._to_int(entry.get(lt_name) or 0)
                 if hours:
-                    EducationalPlanEntry.objects.create(
-                        educational_plan=educational_plan,
-                        subject=subject,
-                        lesson_type=lt_name,
-                        hours=hours,
-                    )
+                    hours_by_key[subject.id, lt_name] = hours
+        return hours_by_key
+
+    def handle_plan_entries(self, educational_plan, entries_data):
+        hours_by_key = self.parse_plan_entries(entries_data)
+
+        existing = {}
+        to_delete = []
+        for entry in educational_plan.entries.all():
+            key = (entry.subject_id, entry.lesson_type)
+            if key in existing or key not in hours_by_key:
+                to_delete.append(entry.id)
+            else:
+                existing[key] = entry
+
+        to_update = []
+        for key, entry in existing.items():
+            if entry.hours != hours_by_key[key]:
+                entry.hours = hours_by_key[key]
+                to_update.append(entry)
+        to_create = [
+            EducationalPlanEntry(
+                educational_plan=educational_plan,
+                subject_id=subject_id,
+                lesson_type=lt_name,
+                hours=hours,
+            )
+            for (subject_id, lt_name), hours in hours_by_key.items()
+            if (subject_id, lt_name) not in existing
+        ]
+
+        with transaction.atomic():
+            if to_delete:
+                EducationalPlanEntry.objects.filter(id__in=to_delete).delete()
+            EducationalPlanEntry.objects.bulk_update(to_update, ["hours"])
+            refresh_on_commit(entry_ids=[entry.id for entry in to_update])
+            EducationalPlanEntry.objects.bulk_create(to_create)
+            bump(EducationalPlanEntry)
+            plan_id = educational_plan.id
+            transaction.on_commit(lambda: refresh_plan_hours([plan_id]))
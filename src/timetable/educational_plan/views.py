@@ -1,23 +1,30 @@
-from rest_framework import filters, viewsets
+from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from .models import EducationalPlan
+from timetable.conditional import ConditionalGetMixin
+from timetable.search import RankedSearchFilter
+from timetable.sparse import SparseFieldsViewSetMixin
+
+from .models import EducationalPlan, EducationalPlanEntry
 from .serializers import (
     EducationalPlanEntrySerializer,
     EducationalPlanSerializer,
 )
 
 
-class EducationalPlanViewSet(viewsets.ModelViewSet):
+class EducationalPlanViewSet(
+    ConditionalGetMixin, SparseFieldsViewSetMixin, viewsets.ModelViewSet
+):
     queryset = EducationalPlan.objects.all()
     serializer_class = EducationalPlanSerializer
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [RankedSearchFilter]
     search_fields = ["name"]
+    versioned_models = [EducationalPlan, EducationalPlanEntry]
 
     @action(detail=True, methods=["get"])
     def entries(self, request, pk=None):
         educational_plan = self.get_object()
-        entries = educational_plan.entries.all()
+        entries = educational_plan.entries.select_related("subject")
         serializer = EducationalPlanEntrySerializer(entries, many=True)
         return Response(serializer.data)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class GroupEducationalPlanConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "group_educational_plan"
+
+    def ready(self):
+        from . import receivers  # noqa: F401
@@ -0,0 +1,83 @@
+from collections import Counter
+
+from django.db.models import Count, F, Sum
+
+from educational_plan.models import EducationalPlanEntry
+
+from schedule.models import Lesson
+
+from .models import GroupEducationalPlan, GroupEducationalPlanHours
+
+LESSON_TYPES = [
+    lesson_type for lesson_type, _ in EducationalPlanEntry.LESSON_TYPE_CHOICES
+]
+
+
+def refresh_hours(group_plan_ids, scheduled=False):
+    """
+    Пересчитывает плановые часы (и фактические, если ``scheduled``)
+    для указанных планов групп одним агрегирующим запросом.
+    """
+    planned = Counter()
+    existing = set()
+    for gp_id, lesson_type, total in (
+        GroupEducationalPlan.objects.filter(id__in=group_plan_ids)
+        .values("id", "educational_plan__entries__lesson_type")
+        .annotate(total=Sum("educational_plan__entries__hours"))
+        .values_list("id", "educational_plan__entries__lesson_type", "total")
+    ):
+        existing.add(gp_id)
+        if lesson_type:
+            planned[gp_id, lesson_type] = total or 0
+
+    counted = Counter()
+    if scheduled:
+        for gp_id, lesson_type, total in (
+            Lesson.objects.filter(group_educational_plan_id__in=existing)
+            .values("group_educational_plan_id", "lesson_type")
+            .annotate(total=Count("id"))
+            .values_list("group_educational_plan_id", "lesson_type", "total")
+        ):
+            counted[gp_id, lesson_type] = total
+
+    GroupEducationalPlanHours.objects.bulk_create(
+        [
+            GroupEducationalPlanHours(
+                group_educational_plan_id=gp_id,
+                lesson_type=lesson_type,
+                planned=planned[gp_id, lesson_type],
+                scheduled=counted[gp_id, lesson_type],
+            )
+            for gp_id in existing
+            for lesson_type in LESSON_TYPES
+        ],
+        update_conflicts=True,
+        unique_fields=["group_educational_plan", "lesson_type"],
+        update_fields=["planned", "scheduled"] if scheduled else ["planned"],
+    )
+
+
+def refresh_plan_hours(plan_ids):
+    refresh_hours(
+        GroupEducationalPlan.objects.filter(
+            educational_plan_id__in=plan_ids
+        ).values_list("id", flat=True)
+    )
+
+
+def count_scheduled(lessons, sign=1):
+    """Сдвигает счётчик фактических часов на число занятий через F()."""
+    counts = Counter(
+        (lesson.group_educational_plan_id, lesson.lesson_type)
+        for lesson in lessons
+        if lesson.group_educational_plan_id
+    )
+    missing = set()
+    for (gp_id, lesson_type), count in counts.items():
+        updated = GroupEducationalPlanHours.objects.filter(
+            group_educational_plan_id=gp_id, lesson_type=lesson_type
+        ).update(scheduled=F("scheduled") + sign * count)
+        if not updated and sign > 0:
+            missing.add(gp_id)
+    if missing:
+        refresh_hours(missing, scheduled=True)
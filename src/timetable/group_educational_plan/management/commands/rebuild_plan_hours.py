@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from group_educational_plan.counters import refresh_hours
+from group_educational_plan.models import GroupEducationalPlan
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает счётчики часов планов групп по урокам и планам"
+
+    def handle(self, *args, **options):
+        ids = list(GroupEducationalPlan.objects.values_list("id", flat=True))
+        with transaction.atomic():
+            refresh_hours(ids, scheduled=True)
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитано планов групп: {len(ids)}")
+        )
@@ -1,6 +1,6 @@
 from django.db import models
 
-from educational_plan.models import EducationalPlan
+from educational_plan.models import EducationalPlan, EducationalPlanEntry
 
 from groups.models import Group
 
@@ -14,3 +14,38 @@ class GroupEducationalPlan(models.Model):
 
     def __str__(self):
         return f"{self.group.name} - {self.educational_plan.name}"
+
+
+class GroupEducationalPlanHours(models.Model):
+    """
+    Счётчики часов плана группы по типу занятия: сколько запланировано,
+    сколько уже стоит в расписании и сколько осталось.
+    """
+
+    group_educational_plan = models.ForeignKey(
+        GroupEducationalPlan, on_delete=models.CASCADE, related_name="hours"
+    )
+    lesson_type = models.CharField(
+        max_length=2, choices=EducationalPlanEntry.LESSON_TYPE_CHOICES
+    )
+    planned = models.IntegerField(default=0)
+    scheduled = models.IntegerField(default=0)
+    remaining = models.GeneratedField(
+        expression=models.F("planned") - models.F("scheduled"),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["group_educational_plan", "lesson_type"],
+                name="unique_group_plan_hours",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.group_educational_plan} - {self.lesson_type}: "
+            f"{self.scheduled}/{self.planned}"
+        )
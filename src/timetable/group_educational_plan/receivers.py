@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from educational_plan.models import EducationalPlanEntry
+
+from .counters import refresh_hours, refresh_plan_hours
+from .models import GroupEducationalPlan
+
+
+@receiver(post_save, sender=GroupEducationalPlan)
+def group_plan_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: refresh_hours([instance.id], scheduled=True))
+
+
+@receiver(post_save, sender=EducationalPlanEntry)
+@receiver(post_delete, sender=EducationalPlanEntry)
+def plan_entry_changed(sender, instance, **kwargs):
+    plan_id = instance.educational_plan_id
+    transaction.on_commit(lambda: refresh_plan_hours([plan_id]))
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from rest_framework.fields import DateField
 
+from timetable.sparse import SparseFieldsSerializerMixin
+
 from .models import GroupEducationalPlan
 
 
@@ -11,7 +13,9 @@ class NullableDateField(DateField):
         return super().to_internal_value(value)
 
 
-class GroupEducationalPlanSerializer(serializers.ModelSerializer):
+class GroupEducationalPlanSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     group_name = serializers.CharField(source="group.name", read_only=True)
     educational_plan_name = serializers.CharField(
         source="educational_plan.name", read_only=True
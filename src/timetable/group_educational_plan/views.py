@@ -1,20 +1,39 @@
 from http import HTTPStatus
 
-from rest_framework import filters, viewsets
+from django.db.models import Q, Sum
+from django.db.models.functions import Coalesce
+
+from educational_plan.models import EducationalPlan
+
+from groups.models import Group
+
+from rest_framework import viewsets
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from .models import GroupEducationalPlan
+from timetable.conditional import ConditionalGetMixin
+from timetable.search import RankedSearchFilter
+from timetable.sparse import SparseFieldsViewSetMixin
+from timetable.streaming import StreamingListMixin
+
+from .counters import LESSON_TYPES
+from .models import GroupEducationalPlan, GroupEducationalPlanHours
 from .serializers import GroupEducationalPlanSerializer
 
 
-class GroupEducationalPlanViewSet(viewsets.ModelViewSet):
+class GroupEducationalPlanViewSet(
+    ConditionalGetMixin,
+    SparseFieldsViewSetMixin,
+    StreamingListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = GroupEducationalPlan.objects.select_related(
         "group", "educational_plan"
     ).all()
     serializer_class = GroupEducationalPlanSerializer
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [RankedSearchFilter]
     search_fields = ["group__name", "educational_plan__name"]
+    versioned_models = [GroupEducationalPlan, Group, EducationalPlan]
 
 
 @api_view(["GET"])
@@ -26,16 +45,53 @@ def group_plan_remaining(request):
         )
 
     total = {"УП": 0, "КЛ": 0, "ДК": 0}
-    try:
-        gep = GroupEducationalPlan.objects.select_related(
-            "educational_plan"
-        ).get(group_id=group_id)
-    except GroupEducationalPlan.DoesNotExist:
-        return Response(total, status=HTTPStatus.OK)
-
-    for entry in gep.educational_plan.entries.all():
-        lt_name = entry.lesson_type
-        if lt_name in total:
-            total[lt_name] += entry.hours
+    for lesson_type, remaining in GroupEducationalPlanHours.objects.filter(
+        group_educational_plan__group_id=group_id
+    ).values_list("lesson_type", "remaining"):
+        total[lesson_type] += remaining
 
     return Response(total, status=HTTPStatus.OK)
+
+
+@api_view(["GET"])
+def groups_plan_remaining(request):
+    groups = Group.objects.order_by("id")
+    group_ids = request.query_params.get("group_ids")
+    if group_ids:
+        groups = groups.filter(
+            id__in=[value for value in group_ids.split(",") if value.isdigit()]
+        )
+
+    aliases = {
+        lesson_type: f"lt{i}" for i, lesson_type in enumerate(LESSON_TYPES)
+    }
+    rows = groups.values("id", "name").annotate(
+        **{
+            alias: Coalesce(
+                Sum(
+                    "groupeducationalplan__hours__remaining",
+                    filter=Q(
+                        groupeducationalplan__hours__lesson_type=lesson_type
+                    ),
+                ),
+                0,
+            )
+            for lesson_type, alias in aliases.items()
+        },
+        planned=Coalesce(Sum("groupeducationalplan__hours__planned"), 0),
+    )
+    return Response(
+        [
+            {
+                "group_id": row["id"],
+                "group_name": row["name"],
+                **{
+                    lesson_type: row[alias]
+                    for lesson_type, alias in aliases.items()
+                },
+                "planned": row["planned"],
+            }
+            for row in rows
+        ],
+        status=HTTPStatus.OK,
+    )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from groups.models import GroupAvailableDates
+
+from teacher.models import TeacherUnavailableDates
+
+
+class Command(BaseCommand):
+    help = (
+        "Переносит даты доступности групп и недоступности преподавателей "
+        "из JSON-списков в построчные таблицы"
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            for model in (GroupAvailableDates, TeacherUnavailableDates):
+                count = 0
+                for record in model.objects.iterator(chunk_size=500):
+                    record.sync_days()
+                    count += 1
+                self.stdout.write(f"{model.__name__}: {count}")
+        self.stdout.write(self.style.SUCCESS("Синхронизация завершена!"))
@@ -1,9 +1,21 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
+
+from timetable.dates import parse_dates
 
 
 class Group(models.Model):
     name = models.CharField(max_length=100)
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="group_search_trgm_idx",
+            )
+        ]
+
     def __str__(self):
         return self.name
 
@@ -14,5 +26,47 @@ class GroupAvailableDates(models.Model):
     )
     dates = models.JSONField(default=list, blank=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.sync_days()
+
+    def delete(self, *args, **kwargs):
+        GroupAvailableDay.objects.filter(group_id=self.group_id).delete()
+        return super().delete(*args, **kwargs)
+
+    def sync_days(self):
+        days = parse_dates(self.dates)
+        existing = set(
+            GroupAvailableDay.objects.filter(
+                group_id=self.group_id
+            ).values_list("date", flat=True)
+        )
+        GroupAvailableDay.objects.filter(
+            group_id=self.group_id, date__in=existing - days
+        ).delete()
+        GroupAvailableDay.objects.bulk_create(
+            GroupAvailableDay(group_id=self.group_id, date=day)
+            for day in days - existing
+        )
+
     def __str__(self):
         return f"Доступные даты: {self.group}"
+
+
+class GroupAvailableDay(models.Model):
+    """Доступная дата группы — по строке на дату, для индексных запросов."""
+
+    group = models.ForeignKey(
+        Group, on_delete=models.CASCADE, related_name="available_days"
+    )
+    date = models.DateField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["group", "date"], name="unique_group_available_day"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.group} - {self.date}"
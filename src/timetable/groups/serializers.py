@@ -1,15 +1,21 @@
 from rest_framework import serializers
 
+from timetable.sparse import SparseFieldsSerializerMixin
+
 from .models import Group, GroupAvailableDates
 
 
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Group
         fields = ["id", "name"]
 
 
-class GroupAvailableDatesSerializer(serializers.ModelSerializer):
+class GroupAvailableDatesSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     group_id = serializers.PrimaryKeyRelatedField(
         queryset=Group.objects.all(), source="group", write_only=True
     )
@@ -2,13 +2,19 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from timetable.conditional import ConditionalGetMixin
+from timetable.sparse import SparseFieldsViewSetMixin
+
 from .models import Group, GroupAvailableDates
 from .serializers import GroupAvailableDatesSerializer, GroupSerializer
 
 
-class GroupViewSet(viewsets.ModelViewSet):
+class GroupViewSet(
+    ConditionalGetMixin, SparseFieldsViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Group.objects.all()
     serializer_class = GroupSerializer
+    versioned_models = [Group]
 
     @action(detail=True, methods=["get"], url_path="available_dates")
     def available_dates_action(self, request, pk=None):
@@ -19,7 +25,9 @@ class GroupViewSet(viewsets.ModelViewSet):
             return Response({"dates": []}, status=200)
 
 
-class GroupAvailableDatesViewSet(viewsets.ModelViewSet):
+class GroupAvailableDatesViewSet(
+    SparseFieldsViewSetMixin, viewsets.ModelViewSet
+):
     queryset = GroupAvailableDates.objects.all()
     serializer_class = GroupAvailableDatesSerializer
 
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.worker import claim_job, reclaim_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "Выполнение фоновых задач из очереди в базе данных."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Выполнить задачи из очереди и завершиться",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=2.0,
+            help="Пауза между проверками пустой очереди, секунд",
+        )
+
+    def handle(self, *args, **kwargs):
+        requeued, failed = reclaim_stale_jobs()
+        if requeued or failed:
+            self.stdout.write(
+                f"Зависшие задачи: в очередь {requeued}, с ошибкой {failed}"
+            )
+        while True:
+            close_old_connections()
+            job = claim_job()
+            if job is not None:
+                job = run_job(job)
+                self.stdout.write(f"{job}")
+                continue
+            if kwargs["once"]:
+                return
+            time.sleep(kwargs["sleep"])
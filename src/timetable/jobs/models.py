@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATE_CHOICES = [
+        (PENDING, "В очереди"),
+        (RUNNING, "Выполняется"),
+        (DONE, "Завершено"),
+        (FAILED, "Ошибка"),
+    ]
+
+    kind = models.CharField(max_length=50)
+    state = models.CharField(
+        max_length=10, choices=STATE_CHOICES, default=PENDING
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    file = models.BinaryField(null=True, blank=True)
+    processed = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    result = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Воркер отмечается при захвате задачи и при каждом report().
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [models.Index(fields=["state", "created_at"])]
+
+    @property
+    def progress(self):
+        if self.state == self.DONE:
+            return 100
+        if not self.total:
+            return 0
+        return min(100, self.processed * 100 // self.total)
+
+    def report(self, processed, total):
+        self.processed = processed
+        self.total = total
+        self.heartbeat_at = timezone.now()
+        Job.objects.filter(pk=self.pk).update(
+            processed=processed, total=total, heartbeat_at=self.heartbeat_at
+        )
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.get_state_display()})"
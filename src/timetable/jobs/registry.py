@@ -0,0 +1,21 @@
+"""
+Обработчики фоновых задач.
+
+Приложения регистрируют обработчики в своих модулях ``jobs.py``,
+которые загружаются при старте. Обработчик получает ``Job`` и
+возвращает JSON-совместимый результат.
+"""
+
+_handlers = {}
+
+
+def register(kind):
+    def decorator(handler):
+        _handlers[kind] = handler
+        return handler
+
+    return decorator
+
+
+def get_handler(kind):
+    return _handlers.get(kind)
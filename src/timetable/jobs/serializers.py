@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from timetable.sparse import SparseFieldsSerializerMixin
+
+from .models import Job
+
+
+class JobSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    progress = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "kind",
+            "state",
+            "progress",
+            "processed",
+            "total",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        sparse_sources = {"progress": ["state", "processed", "total"]}
@@ -0,0 +1,18 @@
+from rest_framework import viewsets
+
+from timetable.sparse import SparseFieldsViewSetMixin
+
+from .models import Job
+from .serializers import JobSerializer
+
+
+class JobViewSet(SparseFieldsViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Job.objects.defer("file", "payload")
+    serializer_class = JobSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        user = self.request.user
+        if not user.is_staff:
+            queryset = queryset.filter(created_by=user)
+        return queryset
@@ -0,0 +1,73 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+def claim_job():
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(state=Job.PENDING)
+            .order_by("created_at", "id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.state = Job.RUNNING
+        job.started_at = job.heartbeat_at = timezone.now()
+        job.attempts = F("attempts") + 1
+        job.save(
+            update_fields=["state", "started_at", "heartbeat_at", "attempts"]
+        )
+        job.refresh_from_db(fields=["attempts"])
+    return job
+
+
+def reclaim_stale_jobs():
+    """
+    Задачи в состоянии «выполняется», чей воркер давно не отмечался
+    (упал или был остановлен при деплое), возвращаются в очередь. После
+    ``JOBS_MAX_ATTEMPTS`` попыток задача помечается ошибкой.
+    Возвращает ``(возвращено, с ошибкой)``.
+    """
+    now = timezone.now()
+    limit = now - timedelta(seconds=settings.JOBS_STALE_TIMEOUT)
+    stale = Job.objects.filter(
+        Q(heartbeat_at__lt=limit)
+        | Q(heartbeat_at__isnull=True, started_at__lt=limit),
+        state=Job.RUNNING,
+    )
+    failed = stale.filter(attempts__gte=settings.JOBS_MAX_ATTEMPTS).update(
+        state=Job.FAILED,
+        error="Воркер остановился, не завершив задачу.",
+        file=None,
+        finished_at=now,
+    )
+    requeued = stale.update(state=Job.PENDING)
+    return requeued, failed
+
+
+def run_job(job):
+    handler = get_handler(job.kind)
+    try:
+        if handler is None:
+            raise LookupError(f"Неизвестный тип задачи: {job.kind}")
+        job.result = handler(job) or {}
+        job.state = Job.DONE
+    except Exception as e:
+        logger.exception("Job %s failed", job.pk)
+        job.state = Job.FAILED
+        job.error = str(e)
+    job.file = None
+    job.finished_at = timezone.now()
+    job.save(update_fields=["state", "result", "error", "file", "finished_at"])
+    return job
@@ -0,0 +1,41 @@
+from educational_plan.models import EducationalPlanEntry
+
+from timetable.xlsx import write_table
+
+COLUMNS = [
+    ("Дата", 12),
+    ("Группа", 16),
+    ("Дисциплина", 40),
+    ("Вид занятия", 24),
+    ("Бригада", 10),
+    ("Преподаватель", 24),
+]
+
+
+def lesson_rows(lessons, chunk_size=2000):
+    types = dict(EducationalPlanEntry.LESSON_TYPE_CHOICES)
+    rows = lessons.order_by(
+        "group__name", "date", "brigade_number", "id"
+    ).values_list(
+        "date",
+        "group__name",
+        "educational_plan_entry__subject__name",
+        "lesson_type",
+        "brigade_number",
+        "teacher__shortname",
+    )
+    for day, group, subject, lesson_type, brigade, teacher in rows.iterator(
+        chunk_size=chunk_size
+    ):
+        yield [
+            day,
+            group,
+            subject,
+            types.get(lesson_type, lesson_type),
+            brigade,
+            teacher,
+        ]
+
+
+def write_lessons(file, lessons):
+    write_table(file, "Расписание", COLUMNS, lesson_rows(lessons))
@@ -0,0 +1,148 @@
+"""
+Подписка на расписание группы или преподавателя в формате iCalendar.
+
+Адрес ленты содержит подписанный токен (``group:5:…``), поэтому
+календарные клиенты забирают её без JWT. Каждое занятие — событие на
+весь день. Лента пишется потоково и кэшируется по ETag; ETag строится
+из версии ленты (``ics:group:5``), которую увеличивают сигналы занятий,
+и версий справочников, чьи названия попадают в события. Неизменённая
+лента отдаётся из кэша или ответом 304 без обращения к занятиям.
+"""
+
+import datetime
+
+from django.core import signing
+
+from groups.models import Group
+
+from teacher.models import Teacher
+
+from .models import Lesson
+
+SALT = "schedule.ics"
+PRODID = "-//is_schedule//Расписание практики//RU"
+
+FEEDS = {
+    "group": (Group, "group_id"),
+    "teacher": (Teacher, "teacher_id"),
+}
+
+# Справочники, чьи названия выводятся в события ленты.
+FEED_SOURCES = [
+    "educational_plan.EducationalPlanEntry",
+    "groups.Group",
+    "subject.Subject",
+    "teacher.Teacher",
+]
+
+
+def feed_label(kind, pk):
+    return f"ics:{kind}:{pk}"
+
+
+def feed_labels(lessons):
+    labels = set()
+    for lesson in lessons:
+        labels.add(feed_label("group", lesson.group_id))
+        labels.add(feed_label("teacher", lesson.teacher_id))
+    return labels
+
+
+def make_token(kind, pk):
+    return signing.Signer(salt=SALT).sign(f"{kind}:{pk}")
+
+
+def parse_token(token):
+    """Возвращает ``(kind, pk)`` или ``None`` для чужого токена."""
+    try:
+        value = signing.Signer(salt=SALT).unsign(token)
+    except signing.BadSignature:
+        return None
+    kind, _, pk = value.partition(":")
+    if kind not in FEEDS or not pk.isdigit():
+        return None
+    return kind, int(pk)
+
+
+def feed_lessons(kind, pk):
+    return (
+        Lesson.objects.filter(**{FEEDS[kind][1]: pk})
+        .select_related("group", "educational_plan_entry__subject", "teacher")
+        .order_by("date", "id")
+    )
+
+
+def escape(text):
+    return (
+        str(text)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Переносит строку по 75 октетов, не разрывая символы UTF-8."""
+    data = line.encode()
+    if len(data) <= 75:
+        return data + b"\r\n"
+    parts = []
+    limit = 75
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and data[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(data[:cut])
+        data = data[cut:]
+        limit = 74
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _date(day):
+    return day.strftime("%Y%m%d")
+
+
+def _event(lesson, stamp):
+    entry = lesson.educational_plan_entry
+    subject = entry.subject.name if entry else "Занятие"
+    summary = f"{subject} ({lesson.get_lesson_type_display()})"
+    details = [f"Группа: {lesson.group.name}"]
+    if lesson.brigade_number:
+        details.append(f"Бригада: {lesson.brigade_number}")
+    details.append(f"Преподаватель: {lesson.teacher.shortname}")
+    description = "\n".join(details)
+    end = lesson.date + datetime.timedelta(days=1)
+    return [
+        "BEGIN:VEVENT",
+        f"UID:lesson-{lesson.pk}@is_schedule",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;VALUE=DATE:{_date(lesson.date)}",
+        f"DTEND;VALUE=DATE:{_date(end)}",
+        f"SUMMARY:{escape(summary)}",
+        f"DESCRIPTION:{escape(description)}",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+
+
+def write_feed(title, lessons, updated_at=None, chunk_size=500):
+    """Генератор байтов ленты; занятия читаются через ``iterator()``."""
+    stamp = updated_at or datetime.datetime.now(datetime.timezone.utc)
+    stamp = stamp.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield b"".join(
+        fold(line)
+        for line in [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape(title)}",
+            "X-PUBLISHED-TTL:PT15M",
+        ]
+    )
+    for lesson in lessons.iterator(chunk_size=chunk_size):
+        yield b"".join(fold(line) for line in _event(lesson, stamp))
+    yield fold("END:VCALENDAR")
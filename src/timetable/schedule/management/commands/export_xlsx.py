@@ -0,0 +1,49 @@
+import time
+
+from brigade_assignment.exports import write_matrix
+
+from django.core.management.base import BaseCommand
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from schedule.exports import write_lessons
+from schedule.models import Lesson
+
+
+class Command(BaseCommand):
+    help = "Выгрузка расписания или назначений бригад в xlsx."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "kind",
+            choices=["schedule", "brigades"],
+            help="schedule — занятия, brigades — назначения бригад",
+        )
+        parser.add_argument("output", help="Путь к xlsx файлу")
+        parser.add_argument("--group-id", type=int)
+        parser.add_argument("--teacher-id", type=int)
+        parser.add_argument("--group-educational-plan", type=int)
+
+    def handle(self, *args, **kwargs):
+        started = time.monotonic()
+        with open(kwargs["output"], "wb") as file:
+            if kwargs["kind"] == "brigades":
+                group_plans = GroupEducationalPlan.objects.all()
+                if kwargs["group_educational_plan"]:
+                    group_plans = group_plans.filter(
+                        id=kwargs["group_educational_plan"]
+                    )
+                write_matrix(file, group_plans)
+            else:
+                lessons = Lesson.objects.all()
+                if kwargs["group_id"]:
+                    lessons = lessons.filter(group_id=kwargs["group_id"])
+                if kwargs["teacher_id"]:
+                    lessons = lessons.filter(teacher_id=kwargs["teacher_id"])
+                write_lessons(file, lessons)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Файл {kwargs['output']} сохранён "
+                f"за {time.monotonic() - started:.1f} с"
+            )
+        )
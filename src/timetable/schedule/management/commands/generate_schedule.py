@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from schedule.models import Lesson
+from schedule.solver import ScheduleSolver
+
+
+class Command(BaseCommand):
+    help = "Автоматически раскладывает часы учебных планов по датам"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--group-plan",
+            type=int,
+            action="append",
+            dest="group_plans",
+            help="ID привязки плана к группе (можно указать несколько раз)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Только посчитать, ничего не сохранять",
+        )
+
+    def handle(self, *args, **options):
+        group_plans = GroupEducationalPlan.objects.all()
+        if options["group_plans"]:
+            group_plans = group_plans.filter(id__in=options["group_plans"])
+
+        with transaction.atomic():
+            result = ScheduleSolver(group_plans).solve()
+            if not options["dry_run"]:
+                Lesson.objects.bulk_create(result.lessons, batch_size=1000)
+
+        for item in result.unplaced:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Не размещено {hours} ч.: план группы "
+                    "{group_educational_plan}, запись "
+                    "{educational_plan_entry}, бригада {brigade_number} "
+                    "({reason})".format(**item)
+                )
+            )
+        verb = "Рассчитано" if options["dry_run"] else "Создано"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} занятий: {len(result.lessons)}")
+        )
@@ -0,0 +1,78 @@
+from brigade_assignment.models import BrigadeAssignment
+
+from django.db import models
+
+from educational_plan.models import EducationalPlanEntry
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from groups.models import Group
+
+from teacher.models import Teacher
+
+from timetable.bulk import delete_rows
+
+from .signals import lessons_bulk_created, lessons_bulk_deleted
+
+
+class LessonQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        lessons_bulk_created.send(sender=self.model, lessons=objs)
+        return objs
+
+    def bulk_delete(self):
+        # Один DELETE без post_delete на каждую строку: получатели
+        # узнают об удалении из lessons_bulk_deleted. На занятия не
+        # ссылаются другие таблицы, каскад не нужен.
+        lessons = list(self)
+        delete_rows(
+            self.model.objects.filter(pk__in=[lesson.pk for lesson in lessons])
+        )
+        lessons_bulk_deleted.send(sender=self.model, lessons=lessons)
+        return len(lessons)
+
+
+class Lesson(models.Model):
+    group = models.ForeignKey(
+        Group, on_delete=models.CASCADE, related_name="lessons"
+    )
+    group_educational_plan = models.ForeignKey(
+        GroupEducationalPlan,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="lessons",
+    )
+    educational_plan_entry = models.ForeignKey(
+        EducationalPlanEntry,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="lessons",
+    )
+    brigade_number = models.PositiveSmallIntegerField(
+        choices=BrigadeAssignment.BRIGADE_CHOICES, null=True, blank=True
+    )
+    teacher = models.ForeignKey(
+        Teacher, on_delete=models.CASCADE, related_name="lessons"
+    )
+    date = models.DateField()
+    lesson_type = models.CharField(
+        max_length=2, choices=EducationalPlanEntry.LESSON_TYPE_CHOICES
+    )
+
+    objects = LessonQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["date", "id"]
+        indexes = [
+            models.Index(fields=["group", "date"]),
+            models.Index(fields=["teacher", "date"]),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.date} - {self.group} - {self.lesson_type} - "
+            f"{self.teacher}"
+        )
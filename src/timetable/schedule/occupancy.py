@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+
+from teacher.models import Teacher
+
+from .models import Lesson
+
+
+class OccupancyIndex:
+    """
+    Занятость ресурса (преподавателя, позже — аудитории) по датам.
+
+    Индекс строится один раз по сохранённым занятиям, дальше
+    поддерживается сигналами модели ``Lesson`` и лениво перестраивается
+    после ``invalidate()``. Индекс живёт в памяти процесса, поэтому
+    изменения из других воркеров подхватываются не позже, чем через
+    ``SCHEDULE_OCCUPANCY_MAX_AGE`` секунд. Поэтому индекс — только
+    подсказка для интерфейса; перед записью занятий занятость
+    проверяется по базе, см. ``teacher_busy_slots``.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self._slots = None
+        self._built_at = 0
+        self._lock = threading.RLock()
+
+    def _get_slots(self):
+        with self._lock:
+            age = time.monotonic() - self._built_at
+            if (
+                self._slots is None
+                or age > settings.SCHEDULE_OCCUPANCY_MAX_AGE
+            ):
+                self._slots = self._build()
+                self._built_at = time.monotonic()
+            return self._slots
+
+    def _build(self):
+        slots = defaultdict(lambda: defaultdict(Counter))
+        rows = Lesson.objects.values_list(self.field, "date", "group_id")
+        for resource_id, day, group_id in rows.iterator(chunk_size=5000):
+            slots[resource_id][day][group_id] += 1
+        return slots
+
+    def is_busy(self, resource_id, day, exclude_group=None):
+        with self._lock:
+            groups = self._get_slots().get(resource_id, {}).get(day)
+            if not groups:
+                return False
+            return any(group_id != exclude_group for group_id in groups)
+
+    def busy_dates(self, resource_id, exclude_group=None):
+        with self._lock:
+            days = self._get_slots().get(resource_id, {})
+            return {
+                day
+                for day, groups in days.items()
+                if any(group_id != exclude_group for group_id in groups)
+            }
+
+    def add(self, lessons):
+        with self._lock:
+            if self._slots is None:
+                return
+            for lesson in lessons:
+                resource_id = getattr(lesson, self.field)
+                self._slots[resource_id][lesson.date][lesson.group_id] += 1
+
+    def remove(self, lessons):
+        with self._lock:
+            if self._slots is None:
+                return
+            for lesson in lessons:
+                days = self._slots.get(getattr(lesson, self.field), {})
+                groups = days.get(lesson.date)
+                if not groups:
+                    continue
+                groups[lesson.group_id] -= 1
+                if groups[lesson.group_id] <= 0:
+                    del groups[lesson.group_id]
+                if not groups:
+                    del days[lesson.date]
+
+    def invalidate(self):
+        with self._lock:
+            self._slots = None
+
+
+teacher_occupancy = OccupancyIndex("teacher_id")
+
+
+def teacher_busy_slots(teacher_ids, dates=None, exclude_group=None):
+    """
+    Множество ``(teacher_id, date)``, занятых сохранёнными занятиями.
+
+    Вызывается внутри транзакции записи: строки преподавателей
+    блокируются, поэтому параллельная запись занятий тех же
+    преподавателей дождётся коммита и увидит эти занятия.
+    """
+    list(
+        Teacher.objects.select_for_update()
+        .filter(id__in=teacher_ids)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    lessons = Lesson.objects.filter(teacher_id__in=teacher_ids)
+    if dates is not None:
+        lessons = lessons.filter(date__in=dates)
+    if exclude_group is not None:
+        lessons = lessons.exclude(group_id=exclude_group)
+    return set(lessons.values_list("teacher_id", "date"))
@@ -0,0 +1,80 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from group_educational_plan.counters import count_scheduled, refresh_hours
+
+from teacher_profile.workload import count_lessons, refresh_on_commit
+
+from timetable.versions import bump
+
+from .ics import feed_label, feed_labels
+from .models import Lesson
+from .occupancy import teacher_occupancy
+from .signals import lessons_bulk_created, lessons_bulk_deleted
+
+
+@receiver(pre_save, sender=Lesson)
+def lesson_saving(sender, instance, **kwargs):
+    # Занятие могли перенести в другую группу, план группы или другому
+    # преподавателю: прежние ленты, часы и нагрузка тоже должны
+    # обновиться.
+    instance._previous = None
+    if instance.pk:
+        instance._previous = (
+            Lesson.objects.filter(pk=instance.pk)
+            .values_list("group_id", "teacher_id", "group_educational_plan_id")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Lesson)
+def lesson_saved(sender, instance, created, **kwargs):
+    labels = feed_labels([instance])
+    previous = getattr(instance, "_previous", None)
+    if previous is not None:
+        group_id, teacher_id, _ = previous
+        labels |= {
+            feed_label("group", group_id),
+            feed_label("teacher", teacher_id),
+        }
+    bump(*labels)
+    if created:
+        count_scheduled([instance])
+        count_lessons([instance])
+        transaction.on_commit(lambda: teacher_occupancy.add([instance]))
+    else:
+        group_plan_ids = {instance.group_educational_plan_id}
+        teacher_ids = {instance.teacher_id}
+        if previous is not None:
+            group_plan_ids.add(previous[2])
+            teacher_ids.add(previous[1])
+        group_plan_ids.discard(None)
+        if group_plan_ids:
+            refresh_hours(group_plan_ids, scheduled=True)
+        refresh_on_commit(teacher_ids)
+        transaction.on_commit(teacher_occupancy.invalidate)
+
+
+@receiver(post_delete, sender=Lesson)
+def lesson_deleted(sender, instance, **kwargs):
+    bump(*feed_labels([instance]))
+    count_scheduled([instance], -1)
+    count_lessons([instance], -1)
+    transaction.on_commit(lambda: teacher_occupancy.remove([instance]))
+
+
+@receiver(lessons_bulk_created, sender=Lesson)
+def lessons_created(sender, lessons, **kwargs):
+    bump(*feed_labels(lessons))
+    count_scheduled(lessons)
+    count_lessons(lessons)
+    transaction.on_commit(lambda: teacher_occupancy.add(lessons))
+
+
+@receiver(lessons_bulk_deleted, sender=Lesson)
+def lessons_deleted(sender, lessons, **kwargs):
+    bump(*feed_labels(lessons))
+    count_scheduled(lessons, -1)
+    count_lessons(lessons, -1)
+    transaction.on_commit(lambda: teacher_occupancy.remove(lessons))
@@ -0,0 +1,227 @@
+from brigade_assignment.models import BrigadeAssignment
+
+from django.db import transaction
+
+from educational_plan.models import EducationalPlanEntry
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from groups.models import Group, GroupAvailableDay
+
+from rest_framework import serializers
+
+from teacher.models import Teacher, TeacherUnavailableDay
+
+from timetable.sparse import SparseFieldsSerializerMixin
+
+from .ics import FEEDS
+from .models import Lesson
+from .occupancy import teacher_busy_slots
+
+
+class LessonSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
+    group_name = serializers.CharField(source="group.name", read_only=True)
+    subject_name = serializers.CharField(
+        source="educational_plan_entry.subject.name",
+        read_only=True,
+        default=None,
+    )
+    teacher_name = serializers.CharField(
+        source="teacher.shortname", read_only=True
+    )
+
+    class Meta:
+        model = Lesson
+        fields = [
+            "id",
+            "group",
+            "group_name",
+            "group_educational_plan",
+            "educational_plan_entry",
+            "subject_name",
+            "brigade_number",
+            "teacher",
+            "teacher_name",
+            "date",
+            "lesson_type",
+        ]
+
+
+class ScheduleGenerateSerializer(serializers.Serializer):
+    group_educational_plans = serializers.PrimaryKeyRelatedField(
+        queryset=GroupEducationalPlan.objects.all(),
+        many=True,
+        required=False,
+    )
+    dry_run = serializers.BooleanField(default=False)
+
+
+class TeacherSlotSerializer(serializers.Serializer):
+    teacher_id = serializers.IntegerField()
+    date = serializers.DateField()
+    group_id = serializers.IntegerField(required=False)
+
+
+class CalendarLinkSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=sorted(FEEDS))
+    id = serializers.IntegerField()
+
+    def validate(self, attrs):
+        model = FEEDS[attrs["kind"]][0]
+        if not model.objects.filter(pk=attrs["id"]).exists():
+            raise serializers.ValidationError(
+                {"id": "Объект для календаря не найден."}
+            )
+        return attrs
+
+
+class BulkLessonSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    teacher_id = serializers.IntegerField()
+    lesson_type = serializers.ChoiceField(
+        choices=EducationalPlanEntry.LESSON_TYPE_CHOICES
+    )
+    educational_plan_entry = serializers.IntegerField(
+        required=False, allow_null=True
+    )
+    brigade_number = serializers.ChoiceField(
+        choices=BrigadeAssignment.BRIGADE_CHOICES,
+        required=False,
+        allow_null=True,
+    )
+
+
+class ScheduleBulkSerializer(serializers.Serializer):
+    """
+    Календарь группы целиком: все занятия группы заменяются переданными.
+    Проверки выполняются несколькими запросами на весь набор занятий.
+    ``is_valid()`` и ``save()`` вызываются в одной транзакции, в ней же
+    перед записью проверяется занятость преподавателей.
+    """
+
+    group_id = serializers.PrimaryKeyRelatedField(
+        queryset=Group.objects.all(), source="group"
+    )
+    lessons = BulkLessonSerializer(many=True, allow_empty=True)
+
+    def validate(self, attrs):
+        group = attrs["group"]
+        lessons = attrs["lessons"]
+        teacher_ids = {lesson["teacher_id"] for lesson in lessons}
+        dates = {lesson["date"] for lesson in lessons}
+        entry_ids = {
+            lesson.get("educational_plan_entry")
+            for lesson in lessons
+            if lesson.get("educational_plan_entry")
+        }
+
+        self.group_dates = set(
+            GroupAvailableDay.objects.filter(
+                group=group, date__in=dates
+            ).values_list("date", flat=True)
+        )
+        self.teachers = Teacher.objects.in_bulk(teacher_ids)
+        self.entries = EducationalPlanEntry.objects.select_related(
+            "subject"
+        ).in_bulk(entry_ids)
+        self.by_plan, self.by_lesson_type = self._group_plans(group)
+        self.unavailable = set(
+            TeacherUnavailableDay.objects.filter(
+                teacher_id__in=teacher_ids, date__in=dates
+            ).values_list("teacher_id", "date")
+        )
+
+        seen = set()
+        errors = []
+        for lesson in lessons:
+            errors.append(self._lesson_errors(group, lesson, seen))
+        if any(errors):
+            raise serializers.ValidationError({"lessons": errors})
+        return attrs
+
+    def _lesson_errors(self, group, lesson, seen):
+        errors = {}
+        teacher_id = lesson["teacher_id"]
+        day = lesson["date"]
+        entry_id = lesson.get("educational_plan_entry")
+
+        if day not in self.group_dates:
+            errors["date"] = "Группа недоступна в эту дату."
+        if entry_id and entry_id not in self.entries:
+            errors["educational_plan_entry"] = (
+                "Некорректный ID записи учебного плана."
+            )
+        elif (
+            entry_id
+            and self.entries[entry_id].educational_plan_id not in self.by_plan
+        ):
+            errors["educational_plan_entry"] = (
+                "Запись не относится к учебным планам группы."
+            )
+
+        if teacher_id not in self.teachers:
+            errors["teacher_id"] = "Некорректный ID преподавателя."
+        elif (teacher_id, day) in self.unavailable:
+            errors["teacher_id"] = "Преподаватель недоступен в эту дату."
+        elif (teacher_id, day) in seen:
+            errors["teacher_id"] = "Преподаватель указан дважды на одну дату."
+        seen.add((teacher_id, day))
+        return errors
+
+    def _group_plans(self, group):
+        by_plan = {}
+        by_lesson_type = {}
+        for gp_id, plan_id, lesson_type in (
+            GroupEducationalPlan.objects.filter(group=group)
+            .order_by("id")
+            .values_list(
+                "id",
+                "educational_plan_id",
+                "educational_plan__entries__lesson_type",
+            )
+        ):
+            by_plan.setdefault(plan_id, gp_id)
+            by_lesson_type.setdefault(lesson_type, gp_id)
+        return by_plan, by_lesson_type
+
+    def create(self, validated_data):
+        group = validated_data["group"]
+        lessons = []
+        for item in validated_data["lessons"]:
+            entry = self.entries.get(item.get("educational_plan_entry"))
+            if entry is not None:
+                gp_id = self.by_plan[entry.educational_plan_id]
+            else:
+                gp_id = self.by_lesson_type.get(item["lesson_type"])
+            lessons.append(
+                Lesson(
+                    group=group,
+                    group_educational_plan_id=gp_id,
+                    educational_plan_entry=entry,
+                    brigade_number=item.get("brigade_number"),
+                    teacher=self.teachers[item["teacher_id"]],
+                    date=item["date"],
+                    lesson_type=item["lesson_type"],
+                )
+            )
+
+        with transaction.atomic():
+            busy = teacher_busy_slots(
+                {lesson.teacher_id for lesson in lessons},
+                {lesson.date for lesson in lessons},
+                exclude_group=group.id,
+            )
+            errors = [
+                (
+                    {"teacher_id": "Преподаватель уже занят в эту дату."}
+                    if (lesson.teacher_id, lesson.date) in busy
+                    else {}
+                )
+                for lesson in lessons
+            ]
+            if any(errors):
+                raise serializers.ValidationError({"lessons": errors})
+            Lesson.objects.filter(group=group).bulk_delete()
+            return Lesson.objects.bulk_create(lessons, batch_size=1000)
@@ -0,0 +1,9 @@
+from django.dispatch import Signal
+
+# Отправляется после ``Lesson.objects.bulk_create``: обычные post_save
+# для массовой вставки не вызываются. Аргументы: ``lessons``.
+lessons_bulk_created = Signal()
+
+# Отправляется после ``Lesson.objects.bulk_delete()`` вместо post_delete
+# для каждой строки. Аргументы: ``lessons`` — удалённые занятия.
+lessons_bulk_deleted = Signal()
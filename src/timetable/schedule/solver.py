@@ -0,0 +1,232 @@
+"""
+Автоматическое составление расписания практики групп.
+
+Занятость хранится в виде битовых масок: каждой дате календаря
+соответствует один бит, у каждого преподавателя и у каждой бригады
+группы есть своя маска занятых дат. Поиск свободной даты сводится к
+нескольким побитовым операциям над целыми числами, поэтому семестр для
+сотен групп раскладывается за секунды.
+
+Правила:
+    * одно занятие — один час плана (как в ``GroupCalendar``);
+    * часы записи плана делятся между бригадами группы, у которых
+      назначен преподаватель, каждая бригада ведётся своим
+      преподавателем;
+    * у преподавателя не больше одного занятия в день, у бригады — тоже;
+    * занятие ставится только на доступную дату группы в пределах
+      сроков практики плана и дедлайна привязки плана к группе;
+    * уже сохранённые занятия учитываются: они занимают преподавателей
+      и уменьшают количество часов, которые осталось разложить.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from brigade_assignment.models import BrigadeAssignment
+
+from educational_plan.models import EducationalPlanEntry
+
+from groups.models import GroupAvailableDay
+
+from teacher.models import Teacher, TeacherUnavailableDay
+
+from .models import Lesson
+from .occupancy import teacher_busy_slots
+
+
+def split_hours(hours, parts):
+    base, extra = divmod(hours, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+class Calendar:
+    def __init__(self, dates):
+        self.dates = sorted(dates)
+        self.index = {day: i for i, day in enumerate(self.dates)}
+
+    def mask(self, dates):
+        mask = 0
+        for day in dates:
+            i = self.index.get(day)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def window(self, start=None, end=None):
+        mask = 0
+        for day, i in self.index.items():
+            if (start is None or day >= start) and (end is None or day <= end):
+                mask |= 1 << i
+        return mask
+
+
+@dataclass
+class Task:
+    group_plan: object
+    entry: EducationalPlanEntry
+    brigade_number: int
+    teacher_id: int
+    hours: int
+    available: int = 0
+
+
+@dataclass
+class SolverResult:
+    lessons: list = field(default_factory=list)
+    unplaced: list = field(default_factory=list)
+
+
+class ScheduleSolver:
+    def __init__(self, group_plans):
+        self.group_plans = list(
+            group_plans.select_related("group", "educational_plan")
+        )
+
+    def solve(self):
+        result = SolverResult()
+        if not self.group_plans:
+            return result
+
+        group_ids = {gp.group_id for gp in self.group_plans}
+        group_dates = defaultdict(set)
+        for group_id, day in GroupAvailableDay.objects.filter(
+            group_id__in=group_ids
+        ).values_list("group_id", "date"):
+            group_dates[group_id].add(day)
+        calendar = Calendar(set().union(*group_dates.values()))
+        tasks = self._build_tasks(calendar, group_dates)
+        teacher_ids = {task.teacher_id for task in tasks}
+        self.teachers = Teacher.objects.in_bulk(teacher_ids)
+
+        teacher_busy = defaultdict(int)
+        for teacher_id, day in TeacherUnavailableDay.objects.filter(
+            teacher_id__in=teacher_ids,
+            date__in=calendar.dates,
+        ).values_list("teacher_id", "date"):
+            teacher_busy[teacher_id] |= calendar.mask((day,))
+        for teacher_id, day in teacher_busy_slots(teacher_ids, calendar.dates):
+            teacher_busy[teacher_id] |= calendar.mask((day,))
+
+        brigade_busy = defaultdict(int)
+        self._load_lessons(calendar, tasks, brigade_busy)
+
+        tasks.sort(
+            key=lambda t: (
+                t.available & ~teacher_busy[t.teacher_id]
+            ).bit_count()
+        )
+        for task in tasks:
+            self._place(task, calendar, teacher_busy, brigade_busy, result)
+        return result
+
+    def _build_tasks(self, calendar, group_dates):
+        plan_ids = {gp.educational_plan_id for gp in self.group_plans}
+        entries = defaultdict(list)
+        for entry in (
+            EducationalPlanEntry.objects.filter(
+                educational_plan_id__in=plan_ids, hours__gt=0
+            )
+            .select_related("subject")
+            .order_by("subject_id", "lesson_type", "id")
+        ):
+            entries[entry.educational_plan_id].append(entry)
+
+        brigades = defaultdict(list)
+        for gp_id, entry_id, number, teacher_id in (
+            BrigadeAssignment.objects.filter(
+                group_educational_plan__in=self.group_plans
+            )
+            .order_by("brigade_number")
+            .values_list(
+                "group_educational_plan_id",
+                "educational_plan_entry_id",
+                "brigade_number",
+                "teacher_id",
+            )
+        ):
+            brigades[gp_id, entry_id].append((number, teacher_id))
+
+        tasks = []
+        for gp in self.group_plans:
+            plan = gp.educational_plan
+            end = plan.practice_end_date
+            if gp.deadline and (end is None or gp.deadline < end):
+                end = gp.deadline
+            available = calendar.mask(
+                group_dates.get(gp.group_id, ())
+            ) & calendar.window(plan.practice_start_date, end)
+            for entry in entries[gp.educational_plan_id]:
+                staff = brigades[gp.id, entry.id]
+                if not staff:
+                    tasks.append(Task(gp, entry, None, None, entry.hours))
+                    continue
+                shares = split_hours(entry.hours, len(staff))
+                for (number, teacher_id), hours in zip(staff, shares):
+                    tasks.append(
+                        Task(gp, entry, number, teacher_id, hours, available)
+                    )
+        return tasks
+
+    def _load_lessons(self, calendar, tasks, brigade_busy):
+        by_key = {
+            (t.group_plan.id, t.entry.id, t.brigade_number): t for t in tasks
+        }
+        lessons = Lesson.objects.filter(
+            group_id__in={gp.group_id for gp in self.group_plans}
+        )
+        for row in lessons.values_list(
+            "group_id",
+            "group_educational_plan_id",
+            "educational_plan_entry_id",
+            "brigade_number",
+            "date",
+        ):
+            group_id, gp_id, entry_id, number, day = row
+            if number is not None:
+                brigade_busy[group_id, number] |= calendar.mask((day,))
+            task = by_key.get((gp_id, entry_id, number))
+            if task is not None and task.hours > 0:
+                task.hours -= 1
+
+    def _place(self, task, calendar, teacher_busy, brigade_busy, result):
+        if task.hours <= 0:
+            return
+        gp = task.group_plan
+        if task.teacher_id is None:
+            result.unplaced.append(self._unplaced(task, "no_teacher"))
+            return
+        brigade_key = (gp.group_id, task.brigade_number)
+        free = (
+            task.available
+            & ~teacher_busy[task.teacher_id]
+            & ~brigade_busy[brigade_key]
+        )
+        while task.hours and free:
+            bit = free & -free
+            free ^= bit
+            teacher_busy[task.teacher_id] |= bit
+            brigade_busy[brigade_key] |= bit
+            task.hours -= 1
+            result.lessons.append(
+                Lesson(
+                    group=gp.group,
+                    group_educational_plan=gp,
+                    educational_plan_entry=task.entry,
+                    brigade_number=task.brigade_number,
+                    teacher=self.teachers[task.teacher_id],
+                    date=calendar.dates[bit.bit_length() - 1],
+                    lesson_type=task.entry.lesson_type,
+                )
+            )
+        if task.hours:
+            result.unplaced.append(self._unplaced(task, "no_free_dates"))
+
+    @staticmethod
+    def _unplaced(task, reason):
+        return {
+            "group_educational_plan": task.group_plan.id,
+            "educational_plan_entry": task.entry.id,
+            "brigade_number": task.brigade_number,
+            "hours": task.hours,
+            "reason": reason,
+        }
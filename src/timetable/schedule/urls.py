@@ -0,0 +1,13 @@
+from django.urls import path
+
+from rest_framework.routers import DefaultRouter
+
+from .views import LessonViewSet, calendar_feed
+
+router = DefaultRouter()
+router.register(r"schedule", LessonViewSet)
+
+urlpatterns = [
+    path("calendar/<str:token>.ics", calendar_feed, name="calendar_feed"),
+    *router.urls,
+]
@@ -0,0 +1,182 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_GET
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from timetable.conditional import ConditionalGetMixin
+from timetable.sparse import SparseFieldsViewSetMixin
+from timetable.streaming import StreamingListMixin
+from timetable.versions import get_versions
+from timetable.xlsx import xlsx_response
+
+from . import ics
+from .exports import write_lessons
+from .models import Lesson
+from .occupancy import teacher_occupancy
+from .serializers import (
+    CalendarLinkSerializer,
+    LessonSerializer,
+    ScheduleBulkSerializer,
+    ScheduleGenerateSerializer,
+    TeacherSlotSerializer,
+)
+from .solver import ScheduleSolver
+
+
+class LessonViewSet(
+    SparseFieldsViewSetMixin, StreamingListMixin, viewsets.ModelViewSet
+):
+    queryset = Lesson.objects.select_related(
+        "group", "educational_plan_entry__subject", "teacher"
+    ).all()
+    serializer_class = LessonSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        group_id = self.request.query_params.get("group_id")
+        teacher_id = self.request.query_params.get("teacher_id")
+        if group_id:
+            queryset = queryset.filter(group_id=group_id)
+        if teacher_id:
+            queryset = queryset.filter(teacher_id=teacher_id)
+        return queryset
+
+    @action(detail=False, methods=["get"])
+    def is_free(self, request):
+        serializer = TeacherSlotSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        busy = teacher_occupancy.is_busy(
+            data["teacher_id"], data["date"], data.get("group_id")
+        )
+        return Response({**serializer.data, "free": not busy})
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        lessons = self.get_queryset()
+        return xlsx_response(
+            lambda file: write_lessons(file, lessons), "schedule.xlsx"
+        )
+
+    @action(detail=False, methods=["get"])
+    def calendar(self, request):
+        serializer = CalendarLinkSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        token = ics.make_token(data["kind"], data["id"])
+        return Response(
+            {
+                **serializer.data,
+                "url": request.build_absolute_uri(
+                    reverse("calendar_feed", args=[token])
+                ),
+            }
+        )
+
+    @action(detail=False, methods=["post"])
+    def generate(self, request):
+        serializer = ScheduleGenerateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        group_plans = GroupEducationalPlan.objects.all()
+        if data.get("group_educational_plans"):
+            group_plans = group_plans.filter(
+                id__in=[gp.id for gp in data["group_educational_plans"]]
+            )
+
+        with transaction.atomic():
+            result = ScheduleSolver(group_plans).solve()
+            if not data["dry_run"]:
+                Lesson.objects.bulk_create(result.lessons, batch_size=1000)
+
+        return Response(
+            {
+                "created": 0 if data["dry_run"] else len(result.lessons),
+                "lessons": LessonSerializer(result.lessons, many=True).data,
+                "unplaced": result.unplaced,
+            },
+            status=(
+                status.HTTP_200_OK
+                if data["dry_run"]
+                else status.HTTP_201_CREATED
+            ),
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_save(self, request):
+        serializer = ScheduleBulkSerializer(data=request.data)
+        with transaction.atomic():
+            serializer.is_valid(raise_exception=True)
+            lessons = serializer.save()
+        return Response(
+            LessonSerializer(lessons, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+@require_GET
+def calendar_feed(request, token):
+    feed = ics.parse_token(token)
+    if feed is None:
+        raise Http404
+    kind, pk = feed
+    label = ics.feed_label(kind, pk)
+    versions = get_versions([label, *ics.FEED_SOURCES])
+    key = "|".join(f"{name}:{v}" for name, (v, _) in versions.items())
+    digest = hashlib.sha1(f"{kind}:{pk}|{key}".encode()).hexdigest()
+    etag = f'"{digest}"'
+    last_modified = max(
+        (updated for _, updated in versions.values() if updated),
+        default=None,
+    )
+
+    if ConditionalGetMixin.is_not_modified(request, etag, last_modified):
+        response = HttpResponse(status=304)
+    else:
+        cache_key = f"ics:{digest}"
+        body = cache.get(cache_key)
+        if body is not None:
+            response = HttpResponse(body)
+        else:
+            model = ics.FEEDS[kind][0]
+            obj = model.objects.filter(pk=pk).first()
+            if obj is None:
+                raise Http404
+            response = StreamingHttpResponse(
+                _cached(
+                    cache_key,
+                    ics.write_feed(
+                        f"Расписание: {obj}",
+                        ics.feed_lessons(kind, pk),
+                        versions[label][1],
+                    ),
+                )
+            )
+        response["Content-Type"] = "text/calendar; charset=utf-8"
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _cached(cache_key, chunks):
+    # Ленту кэшируем, только если она дописана до конца.
+    written = []
+    for chunk in chunks:
+        written.append(chunk)
+        yield chunk
+    cache.set(cache_key, b"".join(written), settings.CALENDAR_CACHE_TIMEOUT)
@@ -1,9 +1,20 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Subject(models.Model):
     name = models.CharField(max_length=100)
     short_name = models.CharField(max_length=50, default="", blank=True)
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                OpClass(Upper("short_name"), name="gin_trgm_ops"),
+                name="subject_search_trgm_idx",
+            )
+        ]
+
     def __str__(self):
         return self.name
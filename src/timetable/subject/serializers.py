@@ -1,9 +1,13 @@
 from rest_framework import serializers
 
+from timetable.sparse import SparseFieldsSerializerMixin
+
 from .models import Subject
 
 
-class SubjectSerializer(serializers.ModelSerializer):
+class SubjectSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Subject
         fields = ["id", "name", "short_name"]
@@ -1,11 +1,18 @@
-from rest_framework import filters, viewsets
+from rest_framework import viewsets
+
+from timetable.conditional import ConditionalGetMixin
+from timetable.search import RankedSearchFilter
+from timetable.sparse import SparseFieldsViewSetMixin
 
 from .models import Subject
 from .serializers import SubjectSerializer
 
 
-class SubjectViewSet(viewsets.ModelViewSet):
+class SubjectViewSet(
+    ConditionalGetMixin, SparseFieldsViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Subject.objects.all()
     serializer_class = SubjectSerializer
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [RankedSearchFilter]
     search_fields = ["name", "short_name"]
+    versioned_models = [Subject]
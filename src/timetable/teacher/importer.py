@@ -0,0 +1,187 @@
+"""
+Импорт преподавателей и их дисциплин из Excel.
+
+Файл читается построчно в режиме read-only, уже существующие
+преподаватели, дисциплины и профили загружаются один раз в словари,
+а новые записи сохраняются пачками через ``bulk_create``. Каждая пачка
+пишется в своей транзакции, поэтому прогресс фоновой задачи виден
+снаружи, а повторный импорт того же файла пропускает уже
+загруженные строки.
+"""
+
+from dataclasses import asdict, dataclass
+
+from django.db import transaction
+
+from openpyxl import load_workbook
+
+from subject.models import Subject
+
+from teacher_profile.models import TeacherProfile
+
+from timetable.versions import bump
+
+from .models import Teacher
+
+FIO_COLUMN = "ФИО"
+SUBJECT_COLUMN = "Название предмета"
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    created: int = 0
+    skipped: int = 0
+    invalid: int = 0
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def _text(value):
+    return "" if value is None else str(value).strip()
+
+
+class TeacherImporter:
+    """
+    Строка файла: «ФИО» и необязательное «Название предмета».
+
+    ``created`` — строки, добавившие преподавателя или профиль,
+    ``skipped`` — строки, которые уже есть в базе, ``invalid`` — строки
+    без фамилии или имени.
+    """
+
+    def __init__(
+        self, employer_type=Teacher.CONTRIBUTOR, chunk_size=1000, progress=None
+    ):
+        self.employer_type = employer_type
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+    def run(self, file):
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active
+            rows = sheet.iter_rows(values_only=True)
+            header = [_text(value) for value in next(rows, ())]
+            if FIO_COLUMN not in header:
+                raise ValueError(f"В файле нет столбца «{FIO_COLUMN}».")
+            self.fio_index = header.index(FIO_COLUMN)
+            self.subject_index = (
+                header.index(SUBJECT_COLUMN)
+                if SUBJECT_COLUMN in header
+                else None
+            )
+            total = max((sheet.max_row or 1) - 1, 0)
+            return self._import(rows, total)
+        finally:
+            workbook.close()
+
+    def _import(self, rows, total):
+        self._load_lookups()
+        result = ImportResult()
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                self._write_chunk(chunk, result)
+                chunk = []
+                self._report(result, total)
+        self._write_chunk(chunk, result)
+        self._report(result, total)
+        return result
+
+    def _report(self, result, total):
+        if self.progress is not None:
+            self.progress(result, max(total, result.rows))
+
+    def _load_lookups(self):
+        self.teachers = {
+            (t.surname, t.name, t.lastname): t.id
+            for t in Teacher.objects.filter(
+                employer_type=self.employer_type
+            ).only("id", "surname", "name", "lastname")
+        }
+        self.subjects = dict(Subject.objects.values_list("name", "id"))
+        self.profiles = set(
+            TeacherProfile.objects.values_list("teacher_id", "subject_id")
+        )
+
+    def _parse(self, row):
+        fio = _text(row[self.fio_index]) if self.fio_index < len(row) else ""
+        parts = fio.split(maxsplit=2)
+        if len(parts) < 2:
+            return None
+        parts += [""] * (3 - len(parts))
+        subject = ""
+        if self.subject_index is not None and self.subject_index < len(row):
+            subject = _text(row[self.subject_index])
+        return tuple(parts), subject
+
+    @transaction.atomic
+    def _write_chunk(self, chunk, result):
+        parsed = []
+        for row in chunk:
+            if not any(value is not None for value in row):
+                continue
+            result.rows += 1
+            item = self._parse(row)
+            if item is None:
+                result.invalid += 1
+            else:
+                parsed.append(item)
+
+        new_teachers = self._create_teachers({key for key, _ in parsed})
+        self._create_subjects({name for _, name in parsed if name})
+
+        new_profiles = {}
+        for key, subject_name in parsed:
+            teacher_id = self.teachers[key]
+            profile = None
+            if subject_name:
+                profile = (teacher_id, self.subjects[subject_name])
+            if key in new_teachers or (
+                profile is not None
+                and profile not in self.profiles
+                and profile not in new_profiles
+            ):
+                result.created += 1
+            else:
+                result.skipped += 1
+            if profile is not None and profile not in self.profiles:
+                new_profiles[profile] = TeacherProfile(
+                    teacher_id=profile[0], subject_id=profile[1]
+                )
+            new_teachers.discard(key)
+
+        # ON CONFLICT DO NOTHING по ограничению unique_teacher_profile:
+        # профиль, добавленный параллельно, не станет дублем.
+        TeacherProfile.objects.bulk_create(
+            new_profiles.values(), ignore_conflicts=True
+        )
+        self.profiles.update(new_profiles)
+        bump(Teacher, Subject, TeacherProfile)
+
+    def _create_teachers(self, keys):
+        missing = [key for key in keys if key not in self.teachers]
+        teachers = []
+        for surname, name, lastname in missing:
+            teacher = Teacher(
+                surname=surname,
+                name=name,
+                lastname=lastname,
+                employer_type=self.employer_type,
+            )
+            teacher.shortname = teacher.make_shortname()
+            teachers.append(teacher)
+        for teacher in Teacher.objects.bulk_create(teachers):
+            key = (teacher.surname, teacher.name, teacher.lastname)
+            self.teachers[key] = teacher.id
+        return set(missing)
+
+    def _create_subjects(self, names):
+        missing = [name for name in names if name not in self.subjects]
+        for subject in Subject.objects.bulk_create(
+            Subject(name=name) for name in missing
+        ):
+            self.subjects[subject.name] = subject.id
@@ -0,0 +1,15 @@
+from io import BytesIO
+
+from jobs.registry import register
+
+from .importer import TeacherImporter
+from .models import Teacher
+
+
+@register("import_teachers")
+def import_teachers(job):
+    importer = TeacherImporter(
+        employer_type=job.payload.get("employer_type", Teacher.CONTRIBUTOR),
+        progress=lambda result, total: job.report(result.rows, total),
+    )
+    return importer.run(BytesIO(job.file)).as_dict()
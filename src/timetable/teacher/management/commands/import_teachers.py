@@ -1,40 +1,35 @@
 from django.core.management.base import BaseCommand
 
-import pandas as pd
-
-from subject.models import Subject
-
-from teacher.models import Teacher, TeacherProfile
+from teacher.importer import TeacherImporter
+from teacher.models import Teacher
 
 
 class Command(BaseCommand):
+    help = "Импорт преподавателей и их дисциплин из Excel файла."
+
     def add_arguments(self, parser):
         parser.add_argument("file_path", type=str, help="Путь к Excel файлу")
+        parser.add_argument(
+            "--employer-type",
+            choices=list(Teacher.EMPLOYERTYPE),
+            default=Teacher.CONTRIBUTOR,
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
 
     def handle(self, *args, **kwargs):
-        file_path = kwargs["file_path"]
-        data = pd.read_excel(file_path)
-
-        data[["Фамилия", "Имя", "Отчество"]] = data["ФИО"].str.split(
-            " ", expand=True, n=2
+        importer = TeacherImporter(
+            employer_type=kwargs["employer_type"],
+            chunk_size=kwargs["chunk_size"],
+            progress=self.report,
         )
-
-        for _, row in data.iterrows():
-            teacher, created = Teacher.objects.get_or_create(
-                surname=row["Фамилия"],
-                name=row["Имя"],
-                lastname=row["Отчество"],
-                employerType=Teacher.CONTRIBUTOR,
-            )
-            if row["Название предмета"] == "nan":
-                continue
-
-            subject, created = Subject.objects.get_or_create(
-                name=row["Название предмета"]
-            )
-
-            TeacherProfile.objects.get_or_create(
-                teacher=teacher, subject=subject
+        result = importer.run(kwargs["file_path"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Импорт завершен! Добавлено: {result.created}, "
+                f"пропущено: {result.skipped}, "
+                f"с ошибками: {result.invalid}"
             )
+        )
 
-        self.stdout.write(self.style.SUCCESS("Импорт завершен!"))
+    def report(self, result, total):
+        self.stdout.write(f"Обработано строк: {result.rows} из {total}")
@@ -1,4 +1,8 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
+
+from timetable.dates import parse_dates
 
 
 class Teacher(models.Model):
@@ -17,11 +21,26 @@ class Teacher(models.Model):
         max_length=20, choices=EMPLOYERTYPE.items(), default=CONTRIBUTOR
     )
 
+    class Meta:
+        indexes = [
+            GinIndex(
+                OpClass(Upper("surname"), name="gin_trgm_ops"),
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                OpClass(Upper("lastname"), name="gin_trgm_ops"),
+                OpClass(Upper("shortname"), name="gin_trgm_ops"),
+                name="teacher_search_trgm_idx",
+            )
+        ]
+
+    def make_shortname(self):
+        initials = " ".join(
+            f"{part[0]}." for part in (self.name, self.lastname) if part
+        )
+        return f"{self.surname} {initials}"
+
     def save(self, *args, **kwargs):
         if not self.shortname:
-            self.shortname = (
-                f"{self.surname} {self.name[0]}." f" {self.lastname[0]}."
-            )
+            self.shortname = self.make_shortname()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -36,5 +55,50 @@ class TeacherUnavailableDates(models.Model):
     )
     dates = models.JSONField(default=list, blank=True)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.sync_days()
+
+    def delete(self, *args, **kwargs):
+        TeacherUnavailableDay.objects.filter(
+            teacher_id=self.teacher_id
+        ).delete()
+        return super().delete(*args, **kwargs)
+
+    def sync_days(self):
+        days = parse_dates(self.dates)
+        existing = set(
+            TeacherUnavailableDay.objects.filter(
+                teacher_id=self.teacher_id
+            ).values_list("date", flat=True)
+        )
+        TeacherUnavailableDay.objects.filter(
+            teacher_id=self.teacher_id, date__in=existing - days
+        ).delete()
+        TeacherUnavailableDay.objects.bulk_create(
+            TeacherUnavailableDay(teacher_id=self.teacher_id, date=day)
+            for day in days - existing
+        )
+
     def __str__(self):
         return f"{self.teacher} недоступен в даты: {self.dates}"
+
+
+class TeacherUnavailableDay(models.Model):
+    """Дата недоступности преподавателя — по строке на дату."""
+
+    teacher = models.ForeignKey(
+        Teacher, on_delete=models.CASCADE, related_name="unavailable_days"
+    )
+    date = models.DateField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["teacher", "date"],
+                name="unique_teacher_unavailable_day",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.teacher} - {self.date}"
@@ -1,9 +1,14 @@
 from rest_framework import serializers
 
+from timetable.params import split_list
+from timetable.sparse import SparseFieldsSerializerMixin
+
 from .models import Teacher, TeacherUnavailableDates
 
 
-class TeacherSerializer(serializers.ModelSerializer):
+class TeacherSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Teacher
         fields = [
@@ -22,7 +27,9 @@ class TeacherSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class TeacherUnavailableDatesSerializer(serializers.ModelSerializer):
+class TeacherUnavailableDatesSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     teacher_id = serializers.PrimaryKeyRelatedField(
         queryset=Teacher.objects.all(), source="teacher", write_only=True
     )
@@ -38,3 +45,21 @@ class TeacherUnavailableDatesSerializer(serializers.ModelSerializer):
             "teacher_name",
             "dates",
         ]
+
+
+class CommaSeparatedListField(serializers.ListField):
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [data]
+        data = [value for item in data for value in split_list(item)]
+        return super().to_internal_value(data)
+
+
+class TeacherAvailabilitySerializer(serializers.Serializer):
+    teacher_ids = CommaSeparatedListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=1000
+    )
+    dates = CommaSeparatedListField(
+        child=serializers.DateField(), allow_empty=False, max_length=366
+    )
+    group_id = serializers.IntegerField(required=False)
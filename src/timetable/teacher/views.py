@@ -1,49 +1,70 @@
-import traceback
+from collections import defaultdict
 
 from educational_plan.models import EducationalPlanEntry
 
 from group_educational_plan.models import GroupEducationalPlan
 
-import pandas as pd
+from jobs.models import Job
 
-from rest_framework import filters, status, viewsets
+from rest_framework import serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
-from subject.models import Subject
+from schedule.occupancy import teacher_occupancy
 
+from teacher_profile.eligibility import eligible_teachers
 from teacher_profile.models import TeacherProfile
 
-from .models import Teacher, TeacherUnavailableDates
-from .serializers import TeacherSerializer, TeacherUnavailableDatesSerializer
-
-
-class TeacherViewSet(viewsets.ModelViewSet):
+from timetable.conditional import ConditionalGetMixin
+from timetable.search import RankedSearchFilter
+from timetable.sparse import SparseFieldsViewSetMixin
+from timetable.streaming import StreamingListMixin
+
+from .models import Teacher, TeacherUnavailableDates, TeacherUnavailableDay
+from .serializers import (
+    TeacherAvailabilitySerializer,
+    TeacherSerializer,
+    TeacherUnavailableDatesSerializer,
+)
+
+
+class TeacherViewSet(
+    ConditionalGetMixin,
+    SparseFieldsViewSetMixin,
+    StreamingListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Teacher.objects.all()
     serializer_class = TeacherSerializer
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [RankedSearchFilter]
     search_fields = ["surname", "name", "lastname", "shortname"]
+    versioned_models = [
+        Teacher,
+        TeacherProfile,
+        TeacherUnavailableDates,
+        GroupEducationalPlan,
+        EducationalPlanEntry,
+    ]
 
     def get_queryset(self):
         qs = super().get_queryset()
-        request = self.request
-        group_id = request.query_params.get("group_id", None)
-
-        if group_id:
-            try:
-                gp = GroupEducationalPlan.objects.select_related(
-                    "educational_plan"
-                ).get(group_id=group_id)
-                plan_subjects = EducationalPlanEntry.objects.filter(
-                    educational_plan=gp.educational_plan
-                ).values_list("subject_id", flat=True)
-
-                qs = qs.filter(
-                    profiles__subject_id__in=plan_subjects
-                ).distinct()
-            except GroupEducationalPlan.DoesNotExist:
-                return qs.none()
+        params = self.request.query_params
+        available_on = params.get("available_on", None)
+
+        if available_on:
+            day = serializers.DateField().to_internal_value(available_on)
+            qs = qs.exclude(unavailable_days__date=day)
+
+        group_id = params.get("group_id")
+        subject_id = params.get("subject_id")
+        if group_id or subject_id:
+            to_int = serializers.IntegerField().to_internal_value
+            eligible = eligible_teachers.teacher_ids(
+                to_int(group_id) if group_id else None,
+                to_int(subject_id) if subject_id else None,
+            )
+            qs = qs.filter(pk__in=eligible)
 
         return qs
 
@@ -57,46 +78,27 @@ class TeacherViewSet(viewsets.ModelViewSet):
                 {"detail": "Файл не найден."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-        try:
-            data = pd.read_excel(file_obj)
-            data[["Фамилия", "Имя", "Отчество"]] = data["ФИО"].str.split(
-                " ", expand=True, n=2
-            )
-
-            for _, row in data.iterrows():
-                if pd.isna(row.get("Фамилия")) or pd.isna(row.get("Имя")):
-                    continue
-
-                teacher, created = Teacher.objects.get_or_create(
-                    surname=row["Фамилия"],
-                    name=row["Имя"],
-                    lastname=row.get("Отчество", ""),
-                    employer_type=employer_type,
-                )
-
-                subject_name = row.get("Название предмета")
-                if pd.notna(subject_name):
-                    subject, _ = Subject.objects.get_or_create(
-                        name=subject_name
-                    )
-                    TeacherProfile.objects.get_or_create(
-                        teacher=teacher, subject=subject
-                    )
-
-            return Response(
-                {"detail": "Импорт завершен!"}, status=status.HTTP_200_OK
-            )
-
-        except Exception as e:
-            traceback.print_exc()
+        if employer_type not in Teacher.EMPLOYERTYPE:
             return Response(
-                {"detail": f"Ошибка: {str(e)}"},
+                {"detail": f"Неизвестный тип занятости: {employer_type}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-
-class TeacherUnavailableDatesViewSet(viewsets.ModelViewSet):
+        job = Job.objects.create(
+            kind="import_teachers",
+            payload={"employer_type": employer_type},
+            file=file_obj.read(),
+            created_by=request.user,
+        )
+        return Response(
+            {"detail": "Импорт поставлен в очередь.", "job_id": job.id},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class TeacherUnavailableDatesViewSet(
+    SparseFieldsViewSetMixin, viewsets.ModelViewSet
+):
     queryset = TeacherUnavailableDates.objects.all()
     serializer_class = TeacherUnavailableDatesSerializer
 
@@ -106,3 +108,35 @@ class TeacherUnavailableDatesViewSet(viewsets.ModelViewSet):
         if teacher_id:
             queryset = queryset.filter(teacher_id=teacher_id)
         return queryset
+
+    @action(detail=False, methods=["get"])
+    def availability(self, request):
+        """
+        Свободны ли преподаватели в указанные даты.
+
+        Для каждого преподавателя возвращается строка из «0» и «1» по
+        числу дат: «1» — преподаватель свободен в соответствующую дату.
+        """
+        serializer = TeacherAvailabilitySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        teacher_ids = list(dict.fromkeys(data["teacher_ids"]))
+        dates = data["dates"]
+
+        unavailable = defaultdict(set)
+        for teacher_id, day in TeacherUnavailableDay.objects.filter(
+            teacher_id__in=teacher_ids, date__in=dates
+        ).values_list("teacher_id", "date"):
+            unavailable[teacher_id].add(day)
+        teachers = {}
+        for teacher_id in teacher_ids:
+            busy = unavailable[teacher_id]
+            busy |= teacher_occupancy.busy_dates(
+                teacher_id, data.get("group_id")
+            )
+            teachers[str(teacher_id)] = "".join(
+                "0" if day in busy else "1" for day in dates
+            )
+        return Response(
+            {"dates": [day.isoformat() for day in dates], "teachers": teachers}
+        )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TeacherProfileConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "teacher_profile"
+
+    def ready(self):
+        from . import receivers  # noqa: F401
@@ -0,0 +1,81 @@
+"""
+Какие преподаватели могут вести занятия группы.
+
+Преподаватель подходит группе, если в его профиле есть дисциплина
+из любого плана, привязанного к группе. Индекс «группа → дисциплины» и
+«дисциплина → преподаватели» строится целиком двумя запросами и живёт в
+памяти процесса. Перестраивается он, когда меняется версия
+``TeacherProfile``, ``EducationalPlanEntry`` или
+``GroupEducationalPlan`` (см. ``timetable.versions``), поэтому изменения
+из других воркеров видны сразу, а проверка стоит один запрос.
+"""
+
+import threading
+from collections import defaultdict
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from timetable.versions import get_versions
+
+from .models import TeacherProfile
+
+SOURCES = [
+    "educational_plan.EducationalPlanEntry",
+    "group_educational_plan.GroupEducationalPlan",
+    "teacher_profile.TeacherProfile",
+]
+
+
+class EligibilityIndex:
+    def __init__(self):
+        self._version = None
+        self._group_subjects = None
+        self._subject_teachers = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _build(self):
+        group_subjects = defaultdict(set)
+        for group_id, subject_id in (
+            GroupEducationalPlan.objects.filter(
+                educational_plan__entries__isnull=False
+            )
+            .values_list("group_id", "educational_plan__entries__subject_id")
+            .distinct()
+        ):
+            group_subjects[group_id].add(subject_id)
+        subject_teachers = defaultdict(set)
+        for subject_id, teacher_id in TeacherProfile.objects.values_list(
+            "subject_id", "teacher_id"
+        ):
+            subject_teachers[subject_id].add(teacher_id)
+        return group_subjects, subject_teachers
+
+    def _current(self):
+        version = tuple(v for v, _ in get_versions(SOURCES).values())
+        with self._lock:
+            if version != self._version:
+                self._group_subjects, self._subject_teachers = self._build()
+                self._cache = {}
+                self._version = version
+            return self._group_subjects, self._subject_teachers, self._cache
+
+    def teacher_ids(self, group_id=None, subject_id=None):
+        """Множество ID подходящих преподавателей."""
+        group_subjects, subject_teachers, cache = self._current()
+        key = (group_id, subject_id)
+        if key not in cache:
+            subjects = (
+                group_subjects.get(group_id, set())
+                if group_id is not None
+                else set(subject_teachers)
+            )
+            if subject_id is not None:
+                subjects = subjects & {subject_id}
+            cache[key] = frozenset().union(
+                *(subject_teachers.get(s, ()) for s in subjects)
+            )
+        return cache[key]
+
+
+eligible_teachers = EligibilityIndex()
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from teacher.models import Teacher
+
+from teacher_profile.workload import refresh_workload
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает нагрузку преподавателей по назначениям и урокам"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        ids = list(Teacher.objects.values_list("id", flat=True))
+        size = options["chunk_size"]
+        with transaction.atomic():
+            for start in range(0, len(ids), size):
+                end = start + size
+                refresh_workload(ids[start:end])
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитано преподавателей: {len(ids)}")
+        )
@@ -1,5 +1,7 @@
 from django.db import models
 
+from educational_plan.models import EducationalPlanEntry
+
 from subject.models import Subject
 
 from teacher.models import Teacher
@@ -11,6 +13,14 @@ class TeacherProfile(models.Model):
     )
     subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["teacher", "subject"], name="unique_teacher_profile"
+            )
+        ]
+        indexes = [models.Index(fields=["subject", "teacher"])]
+
     def __str__(self):
         return f"{self.teacher} - {self.subject}"
 
@@ -37,3 +47,42 @@ class TeacherProfileAmount(models.Model):
             f"{self.teacher} - "
             f"{self.get_lesson_type_display()} - {self.amount}"
         )
+
+
+class TeacherWorkload(models.Model):
+    """
+    Нагрузка преподавателя по типу занятия: часы по назначениям бригад
+    (``assigned``), допустимый объём из ``TeacherProfileAmount``
+    (``allowed``) и занятия в расписании (``scheduled``).
+    Поддерживается сигналами, см. ``workload.py``.
+    """
+
+    teacher = models.ForeignKey(
+        Teacher, on_delete=models.CASCADE, related_name="workload"
+    )
+    lesson_type = models.CharField(
+        max_length=2, choices=EducationalPlanEntry.LESSON_TYPE_CHOICES
+    )
+    assigned = models.IntegerField(default=0)
+    allowed = models.IntegerField(default=0)
+    scheduled = models.IntegerField(default=0)
+    remaining = models.GeneratedField(
+        expression=models.F("allowed") - models.F("assigned"),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["teacher", "lesson_type"],
+                name="unique_teacher_workload",
+            )
+        ]
+        indexes = [models.Index(fields=["lesson_type", "remaining"])]
+
+    def __str__(self):
+        return (
+            f"{self.teacher} - {self.lesson_type}: "
+            f"{self.assigned}/{self.allowed}"
+        )
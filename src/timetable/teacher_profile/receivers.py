@@ -0,0 +1,41 @@
+from brigade_assignment.models import BrigadeAssignment
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from educational_plan.models import EducationalPlanEntry
+
+from .models import TeacherProfileAmount
+from .workload import refresh_on_commit
+
+
+@receiver(pre_save, sender=BrigadeAssignment)
+def assignment_saving(sender, instance, **kwargs):
+    instance._previous_teacher_ids = set()
+    if instance.pk:
+        instance._previous_teacher_ids = set(
+            BrigadeAssignment.objects.filter(pk=instance.pk).values_list(
+                "teacher_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=BrigadeAssignment)
+@receiver(post_delete, sender=BrigadeAssignment)
+def assignment_changed(sender, instance, **kwargs):
+    refresh_on_commit(
+        {instance.teacher_id, *getattr(instance, "_previous_teacher_ids", ())},
+        [instance.educational_plan_entry_id],
+    )
+
+
+@receiver(post_save, sender=EducationalPlanEntry)
+def plan_entry_saved(sender, instance, created, **kwargs):
+    if not created:
+        refresh_on_commit(entry_ids=[instance.id])
+
+
+@receiver(post_save, sender=TeacherProfileAmount)
+@receiver(post_delete, sender=TeacherProfileAmount)
+def amount_changed(sender, instance, **kwargs):
+    refresh_on_commit([instance.teacher_id])
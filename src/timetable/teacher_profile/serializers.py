@@ -4,10 +4,14 @@ from subject.models import Subject
 
 from teacher.models import Teacher
 
-from .models import TeacherProfile, TeacherProfileAmount
+from timetable.sparse import SparseFieldsSerializerMixin
 
+from .models import TeacherProfile, TeacherProfileAmount, TeacherWorkload
 
-class TeacherProfileSerializer(serializers.ModelSerializer):
+
+class TeacherProfileSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     teacher = serializers.PrimaryKeyRelatedField(
         queryset=Teacher.objects.all()
     )
@@ -31,7 +35,9 @@ class TeacherProfileSerializer(serializers.ModelSerializer):
         ]
 
 
-class TeacherProfileAmountSerializer(serializers.ModelSerializer):
+class TeacherProfileAmountSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     teacher_name = serializers.CharField(
         source="teacher.shortname", read_only=True
     )
@@ -49,3 +55,30 @@ class TeacherProfileAmountSerializer(serializers.ModelSerializer):
             "lesson_type_name",
             "amount",
         ]
+        sparse_sources = {"lesson_type_name": ["lesson_type"]}
+
+
+class TeacherWorkloadSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
+    teacher_name = serializers.CharField(
+        source="teacher.shortname", read_only=True
+    )
+    lesson_type_name = serializers.CharField(
+        source="get_lesson_type_display", read_only=True
+    )
+
+    class Meta:
+        model = TeacherWorkload
+        fields = [
+            "id",
+            "teacher",
+            "teacher_name",
+            "lesson_type",
+            "lesson_type_name",
+            "assigned",
+            "allowed",
+            "scheduled",
+            "remaining",
+        ]
+        sparse_sources = {"lesson_type_name": ["lesson_type"]}
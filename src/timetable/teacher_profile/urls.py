@@ -1,10 +1,13 @@
 from rest_framework.routers import DefaultRouter
 
-from .views import TeacherProfileViewSet
+from .views import TeacherProfileViewSet, TeacherWorkloadViewSet
 
 router = DefaultRouter()
 router.register(
     r"teacher_profiles", TeacherProfileViewSet, basename="teacherprofile"
 )
+router.register(
+    r"teacher_workload", TeacherWorkloadViewSet, basename="teacherworkload"
+)
 
 urlpatterns = router.urls
@@ -1,10 +1,26 @@
+from django.db.models import F
+
 from rest_framework import viewsets
+from rest_framework.filters import OrderingFilter
+
+from subject.models import Subject
+
+from teacher.models import Teacher
 
-from .models import TeacherProfile
-from .serializers import TeacherProfileSerializer
+from timetable.conditional import ConditionalGetMixin
+from timetable.sparse import SparseFieldsViewSetMixin
+from timetable.streaming import StreamingListMixin
 
+from .models import TeacherProfile, TeacherWorkload
+from .serializers import TeacherProfileSerializer, TeacherWorkloadSerializer
 
-class TeacherProfileViewSet(viewsets.ModelViewSet):
+
+class TeacherProfileViewSet(
+    ConditionalGetMixin,
+    SparseFieldsViewSetMixin,
+    StreamingListMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet для управления профилями преподавателей:
     Преподаватель - Предмет.
@@ -12,3 +28,45 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
 
     queryset = TeacherProfile.objects.all()
     serializer_class = TeacherProfileSerializer
+    versioned_models = [TeacherProfile, Teacher, Subject]
+
+
+class TeacherWorkloadViewSet(
+    SparseFieldsViewSetMixin,
+    StreamingListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
+    """
+    Нагрузка преподавателей по типам занятий.
+
+    Фильтры: ``teacher_id``, ``lesson_type``, ``overloaded=true`` (часов
+    назначено больше допустимого). Сортировка: ``?ordering=-remaining``.
+    """
+
+    # Имя преподавателя аннотируется, чтобы по нему работала и
+    # курсорная пагинация.
+    queryset = TeacherWorkload.objects.select_related("teacher").annotate(
+        teacher_name=F("teacher__shortname")
+    )
+    serializer_class = TeacherWorkloadSerializer
+    filter_backends = [OrderingFilter]
+    ordering_fields = [
+        "teacher_name",
+        "lesson_type",
+        "assigned",
+        "allowed",
+        "scheduled",
+        "remaining",
+    ]
+    ordering = ["teacher_name", "lesson_type"]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        params = self.request.query_params
+        if params.get("teacher_id"):
+            queryset = queryset.filter(teacher_id=params["teacher_id"])
+        if params.get("lesson_type"):
+            queryset = queryset.filter(lesson_type=params["lesson_type"])
+        if params.get("overloaded") == "true":
+            queryset = queryset.filter(remaining__lt=0)
+        return queryset
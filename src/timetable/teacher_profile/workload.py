@@ -0,0 +1,162 @@
+"""
+Пересчёт таблицы нагрузки преподавателей ``TeacherWorkload``.
+
+``scheduled`` сдвигается через F() сигналами занятий, как счётчики
+часов планов групп. ``assigned`` и ``allowed`` пересчитываются для
+затронутых преподавателей: часы записи плана делятся между бригадами
+так же, как при автосоставлении расписания, поэтому смена преподавателя
+одной бригады меняет нагрузку всех преподавателей этой записи.
+Изменения внутри транзакции копятся и пересчитываются один раз после
+коммита. Пересчёт блокирует строки нагрузки преподавателей, поэтому
+F()-сдвиг ``scheduled`` из параллельной транзакции не теряется: он
+либо уже закоммичен и попадает в подсчёт, либо ждёт и применяется
+поверх записанного значения.
+"""
+
+import weakref
+from collections import Counter, defaultdict
+
+from brigade_assignment.models import BrigadeAssignment
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Sum
+
+from educational_plan.models import EducationalPlanEntry
+
+from schedule.models import Lesson
+from schedule.solver import split_hours
+
+from teacher.models import Teacher
+
+from .models import TeacherProfileAmount, TeacherWorkload
+
+LESSON_TYPES = [
+    lesson_type for lesson_type, _ in EducationalPlanEntry.LESSON_TYPE_CHOICES
+]
+
+
+def assigned_hours(teacher_ids):
+    mine = BrigadeAssignment.objects.filter(
+        teacher_id__in=teacher_ids,
+        group_educational_plan=OuterRef("group_educational_plan"),
+        educational_plan_entry=OuterRef("educational_plan_entry"),
+    )
+    staff = defaultdict(list)
+    for gp_id, entry_id, hours, lesson_type, teacher_id in (
+        BrigadeAssignment.objects.filter(Exists(mine))
+        .order_by("brigade_number")
+        .values_list(
+            "group_educational_plan_id",
+            "educational_plan_entry_id",
+            "educational_plan_entry__hours",
+            "educational_plan_entry__lesson_type",
+            "teacher_id",
+        )
+    ):
+        staff[gp_id, entry_id, hours, lesson_type].append(teacher_id)
+
+    assigned = Counter()
+    for (_, _, hours, lesson_type), teachers in staff.items():
+        for teacher_id, share in zip(
+            teachers, split_hours(hours, len(teachers))
+        ):
+            if teacher_id in teacher_ids:
+                assigned[teacher_id, lesson_type] += share
+    return assigned
+
+
+def refresh_workload(teacher_ids):
+    teacher_ids = set(teacher_ids)
+    with transaction.atomic():
+        list(
+            TeacherWorkload.objects.select_for_update()
+            .filter(teacher_id__in=teacher_ids)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        _write_workload(teacher_ids)
+
+
+def _write_workload(teacher_ids):
+    assigned = assigned_hours(teacher_ids)
+    allowed = Counter()
+    for teacher_id, lesson_type, total in (
+        TeacherProfileAmount.objects.filter(teacher_id__in=teacher_ids)
+        .values("teacher_id", "lesson_type")
+        .annotate(total=Sum("amount"))
+        .values_list("teacher_id", "lesson_type", "total")
+    ):
+        allowed[teacher_id, lesson_type] = total or 0
+    scheduled = Counter()
+    for teacher_id, lesson_type, total in (
+        Lesson.objects.filter(teacher_id__in=teacher_ids)
+        .values("teacher_id", "lesson_type")
+        .annotate(total=Count("id"))
+        .values_list("teacher_id", "lesson_type", "total")
+    ):
+        scheduled[teacher_id, lesson_type] = total
+
+    # Преподаватель мог быть удалён в этой же транзакции.
+    existing = Teacher.objects.filter(id__in=teacher_ids)
+    TeacherWorkload.objects.bulk_create(
+        [
+            TeacherWorkload(
+                teacher_id=teacher_id,
+                lesson_type=lesson_type,
+                assigned=assigned[teacher_id, lesson_type],
+                allowed=allowed[teacher_id, lesson_type],
+                scheduled=scheduled[teacher_id, lesson_type],
+            )
+            for teacher_id in existing.values_list("id", flat=True)
+            for lesson_type in LESSON_TYPES
+        ],
+        update_conflicts=True,
+        unique_fields=["teacher", "lesson_type"],
+        update_fields=["assigned", "allowed", "scheduled"],
+    )
+
+
+# Ожидающие пересчёта ID по соединениям: (преподаватели, записи плана).
+_pending = weakref.WeakKeyDictionary()
+
+
+def _refresh_pending(connection):
+    teacher_ids, entry_ids = _pending.pop(connection, (set(), set()))
+    if entry_ids:
+        teacher_ids.update(
+            BrigadeAssignment.objects.filter(
+                educational_plan_entry_id__in=entry_ids
+            ).values_list("teacher_id", flat=True)
+        )
+    if teacher_ids:
+        refresh_workload(teacher_ids)
+
+
+def refresh_on_commit(teacher_ids=(), entry_ids=()):
+    """
+    Пересчитывает нагрузку после коммита: переданных преподавателей и
+    всех, кто назначен на переданные записи плана. ID копятся на
+    соединении, пересчёт делает первый сработавший колбэк, остальные
+    застают пустой набор.
+    """
+    connection = transaction.get_connection()
+    pending = _pending.setdefault(connection, (set(), set()))
+    pending[0].update(teacher_ids)
+    pending[1].update(entry_ids)
+    transaction.on_commit(lambda: _refresh_pending(connection))
+
+
+def count_lessons(lessons, sign=1):
+    """Сдвигает ``scheduled`` на число занятий через F()."""
+    counts = Counter(
+        (lesson.teacher_id, lesson.lesson_type) for lesson in lessons
+    )
+    missing = set()
+    for (teacher_id, lesson_type), count in counts.items():
+        updated = TeacherWorkload.objects.filter(
+            teacher_id=teacher_id, lesson_type=lesson_type
+        ).update(scheduled=F("scheduled") + sign * count)
+        if not updated and sign > 0:
+            missing.add(teacher_id)
+    if missing:
+        refresh_on_commit(missing)
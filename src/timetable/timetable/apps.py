@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class TimetableConfig(AppConfig):
+    name = "timetable"
+
+    def ready(self):
+        from . import receivers  # noqa: F401
@@ -0,0 +1,114 @@
+"""
+Подсказки для полей ввода преподавателя и дисциплины.
+
+Индекс — отсортированный массив нормализованных ключей, поиск по
+префиксу делается через ``bisect`` без обращения к базе. Ключами
+служат все «хвосты» названия по словам, поэтому «анализ» находит
+«Математический анализ», а «иван» — «Петров Иван Петрович».
+Индекс строится лениво в каждом процессе и перестраивается, когда
+меняется версия модели (см. ``timetable.versions``). Версия читается
+не чаще, чем раз в ``AUTOCOMPLETE_VERSION_TTL`` секунд, поэтому
+изменения из других воркеров и фонового импорта видны через несколько
+секунд, а обычный запрос подсказок к базе не обращается.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+from subject.models import Subject
+
+from teacher.models import Teacher
+
+from .versions import get_versions
+
+
+def normalize(text):
+    return " ".join(str(text).casefold().replace("ё", "е").split())
+
+
+def word_suffixes(text):
+    words = normalize(text).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class PrefixIndex:
+    def __init__(self, model, load):
+        self.model = model
+        self.load = load
+        self._keys = None
+        self._items = None
+        self._version = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def _build(self):
+        entries = []
+        for item_id, label, texts in self.load():
+            for text in texts:
+                for key in word_suffixes(text):
+                    entries.append((key, label, item_id))
+        entries.sort()
+        return (
+            [key for key, _, _ in entries],
+            [(item_id, label) for _, label, item_id in entries],
+        )
+
+    def _get(self):
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._checked_at is None
+                or now - self._checked_at > settings.AUTOCOMPLETE_VERSION_TTL
+            ):
+                ((version, _),) = get_versions([self.model]).values()
+                if version != self._version:
+                    self._keys, self._items = self._build()
+                    self._version = version
+                self._checked_at = now
+            return self._keys, self._items
+
+    def search(self, query, limit=10):
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        keys, items = self._get()
+        result = {}
+        i = bisect_left(keys, prefix)
+        while (
+            i < len(keys)
+            and len(result) < limit
+            and keys[i].startswith(prefix)
+        ):
+            item_id, label = items[i]
+            result.setdefault(item_id, label)
+            i += 1
+        return [
+            {"id": item_id, "label": label}
+            for item_id, label in result.items()
+        ]
+
+
+def _load_teachers():
+    rows = Teacher.objects.values_list(
+        "id", "surname", "name", "lastname", "shortname"
+    )
+    for teacher_id, surname, name, lastname, shortname in rows.iterator():
+        yield teacher_id, shortname, [
+            f"{surname} {name} {lastname}",
+            shortname,
+        ]
+
+
+def _load_subjects():
+    rows = Subject.objects.values_list("id", "name", "short_name")
+    for subject_id, name, short_name in rows.iterator():
+        yield subject_id, name, [name, short_name]
+
+
+indexes = {
+    "teacher": PrefixIndex(Teacher, _load_teachers),
+    "subject": PrefixIndex(Subject, _load_subjects),
+}
@@ -0,0 +1,33 @@
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+
+def delete_rows(queryset):
+    """
+    Удаляет строки выборки одним ``DELETE … WHERE pk IN (SELECT …)``.
+
+    В отличие от ``QuerySet.delete()`` объекты не загружаются, сигналы
+    ``pre_delete``/``post_delete`` не отправляются и каскад не
+    выполняется, поэтому подходит только для таблиц, на которые не
+    ссылаются внешние ключи. Возвращает число удалённых строк.
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    quote = connection.ops.quote_name
+    try:
+        sql, params = (
+            queryset.order_by()
+            .values("pk")
+            .query.get_compiler(queryset.db)
+            .as_sql()
+        )
+    except EmptyResultSet:
+        # Например, ``pk__in=[]``: удалять нечего.
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(model._meta.db_table)} "
+            f"WHERE {quote(model._meta.pk.column)} IN ({sql})",
+            params,
+        )
+        return cursor.rowcount
@@ -0,0 +1,80 @@
+import hashlib
+
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from .versions import get_versions
+
+
+class ConditionalGetMixin:
+    """
+    ETag и Last-Modified для ``list``/``retrieve`` справочников.
+
+    Валидаторы строятся по версиям моделей из ``versioned_models`` и
+    адресу запроса одним запросом к ``ModelVersion``, поэтому ответ
+    ``304 Not Modified`` отдаётся без выборки данных и сериализации.
+    В ``versioned_models`` перечисляются все модели, от которых зависит
+    ответ, включая связанные, чьи поля попадают в выдачу или фильтры.
+    """
+
+    versioned_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        versions = get_versions(self.versioned_models)
+        etag = self.make_etag(request, versions)
+        last_modified = max(
+            (updated for _, updated in versions.values() if updated),
+            default=None,
+        )
+        if self.is_not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    @staticmethod
+    def make_etag(request, versions):
+        key = "|".join(
+            [
+                request.get_full_path(),
+                request.accepted_renderer.format,
+                *(f"{label}:{v}" for label, (v, _) in versions.items()),
+            ]
+        )
+        return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+    @staticmethod
+    def is_not_modified(request, etag, last_modified):
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            etags = {
+                tag.removeprefix("W/") for tag in parse_etags(if_none_match)
+            }
+            return "*" in etags or etag in etags
+        modified_since = parse_http_date_safe(
+            request.headers.get("If-Modified-Since")
+        )
+        return (
+            last_modified is not None
+            and modified_since is not None
+            and int(last_modified.timestamp()) <= modified_since
+        )
@@ -0,0 +1,11 @@
+from datetime import date
+
+
+def parse_dates(values):
+    result = set()
+    for value in values or []:
+        try:
+            result.add(date.fromisoformat(str(value)))
+        except ValueError:
+            continue
+    return result
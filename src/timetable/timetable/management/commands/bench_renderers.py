@@ -0,0 +1,91 @@
+import time
+
+from brigade_assignment.models import BrigadeAssignment
+from brigade_assignment.serializers import BrigadeAssignmentSerializer
+
+from django.core.management.base import BaseCommand
+
+from educational_plan.models import EducationalPlan, EducationalPlanEntry
+
+from group_educational_plan.models import GroupEducationalPlan
+
+from groups.models import Group
+
+from rest_framework.renderers import JSONRenderer
+
+from subject.models import Subject
+
+from teacher.models import Teacher
+
+from timetable.renderers import ORJSONRenderer
+
+
+def sample_assignments(count):
+    """Несохранённые назначения бригад со связанными объектами."""
+    plan = EducationalPlan(id=1, name="Производственная практика")
+    group_plans = [
+        GroupEducationalPlan(
+            id=i, group=Group(id=i, name=f"ИВТ-{i:03d}"), educational_plan=plan
+        )
+        for i in range(300)
+    ]
+    subjects = [Subject(id=i, name=f"Дисциплина №{i}") for i in range(120)]
+    lesson_types = [key for key, _ in EducationalPlanEntry.LESSON_TYPE_CHOICES]
+    entries = [
+        EducationalPlanEntry(
+            id=i,
+            educational_plan=plan,
+            subject=subjects[i % len(subjects)],
+            lesson_type=lesson_types[i % len(lesson_types)],
+            hours=36,
+        )
+        for i in range(600)
+    ]
+    teachers = [
+        Teacher(id=i, surname=f"Иванов{i}", name="Иван", lastname="Иванович")
+        for i in range(500)
+    ]
+    for teacher in teachers:
+        teacher.shortname = teacher.make_shortname()
+    return [
+        BrigadeAssignment(
+            id=i,
+            group_educational_plan=group_plans[i % len(group_plans)],
+            educational_plan_entry=entries[i % len(entries)],
+            brigade_number=i % 4 + 1,
+            teacher=teachers[i % len(teachers)],
+        )
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Сравнение скорости JSONRenderer и ORJSONRenderer."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=5000, help="Строк в ответе"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Повторов замера"
+        )
+
+    def handle(self, *args, **kwargs):
+        data = BrigadeAssignmentSerializer(
+            sample_assignments(kwargs["rows"]), many=True
+        ).data
+        timings = {}
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            best = None
+            for _ in range(kwargs["repeat"]):
+                started = time.perf_counter()
+                body = renderer.render(data)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            name = type(renderer).__name__
+            timings[name] = best
+            self.stdout.write(
+                f"{name}: {best * 1000:.1f} мс, {len(body)} байт"
+            )
+        speedup = timings["JSONRenderer"] / timings["ORJSONRenderer"]
+        self.stdout.write(f"Ускорение: {speedup:.1f}x")
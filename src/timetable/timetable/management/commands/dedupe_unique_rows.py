@@ -0,0 +1,46 @@
+from brigade_assignment.models import BrigadeAssignment
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max, Min
+
+from teacher_profile.models import TeacherProfile
+
+from timetable.bulk import delete_rows
+from timetable.models import ModelVersion
+from timetable.versions import bump
+
+# Модель, поля уникального ключа и какую из строк-дублей оставить.
+TARGETS = [
+    (
+        BrigadeAssignment,
+        ["group_educational_plan", "educational_plan_entry", "brigade_number"],
+        Max,
+    ),
+    (TeacherProfile, ["teacher", "subject"], Min),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаляет дубли, мешающие уникальным ограничениям. Запускается "
+        "перед migrate; таблицы, которых ещё нет, пропускаются"
+    )
+
+    def handle(self, *args, **options):
+        tables = set(connection.introspection.table_names())
+        with transaction.atomic():
+            for model, fields, keep in TARGETS:
+                if model._meta.db_table not in tables:
+                    continue
+                kept = (
+                    model.objects.values(*fields)
+                    .annotate(kept=keep("id"))
+                    .values("kept")
+                )
+                # Без сигналов: таблиц, которые обновляют получатели,
+                # до migrate может ещё не быть.
+                count = delete_rows(model.objects.exclude(id__in=kept))
+                if count and ModelVersion._meta.db_table in tables:
+                    bump(model)
+                self.stdout.write(f"{model.__name__}: удалено {count}")
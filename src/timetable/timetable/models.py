@@ -0,0 +1,12 @@
+from django.db import models
+
+
+class ModelVersion(models.Model):
+    """Счётчик изменений таблицы, из него строятся ETag справочников."""
+
+    label = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.label} v{self.version}"
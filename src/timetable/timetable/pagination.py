@@ -0,0 +1,31 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """
+    Keyset-пагинация по первичному ключу, включаемая клиентом.
+
+    Без параметров ``cursor`` и ``page_size`` список отдаётся целиком,
+    как раньше, поэтому существующие клиенты не ломаются. Результаты
+    ``?search=`` листаются по ``(-search_rank, id)``, чтобы страницы
+    сохраняли сортировку по релевантности.
+    """
+
+    ordering = "id"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        if "search_rank" in queryset.query.annotations:
+            return ("-search_rank", "id")
+        return super().get_ordering(request, queryset, view)
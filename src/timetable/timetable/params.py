@@ -0,0 +1,4 @@
+def split_list(value):
+    """``"a, b,,c"`` → ``["a", "b", "c"]``: пробелы и пустые элементы
+    отбрасываются, порядок сохраняется."""
+    return [item.strip() for item in str(value).split(",") if item.strip()]
@@ -0,0 +1,31 @@
+from django.apps import apps
+from django.db import connections
+from django.db.models.signals import post_delete, post_save, pre_migrate
+from django.dispatch import receiver
+
+from .versions import VERSIONED_MODELS, bump
+
+
+@receiver(pre_migrate, dispatch_uid="timetable_create_extensions")
+def create_extensions(sender, using, **kwargs):
+    # Миграции генерируются при развёртывании, поэтому расширение для
+    # триграммных индексов создаётся здесь, а не операцией миграции.
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def model_changed(sender, **kwargs):
+    bump(sender)
+
+
+for label in VERSIONED_MODELS:
+    model = apps.get_model(label)
+    post_save.connect(
+        model_changed, sender=model, dispatch_uid=f"version_{label}"
+    )
+    post_delete.connect(
+        model_changed, sender=model, dispatch_uid=f"version_{label}"
+    )
@@ -0,0 +1,66 @@
+"""
+Поиск по справочникам на триграммных индексах PostgreSQL.
+
+``SearchFilter`` строит ``ILIKE '%q%'`` по колонкам связанных таблиц
+через JOIN, и такой запрос всегда читает таблицы целиком. Здесь
+условие по связанному полю превращается в подзапрос
+``relation_id IN (SELECT id FROM related WHERE field ILIKE ...)``,
+который обслуживается GIN-индексом ``gin_trgm_ops`` на связанной
+таблице, а результаты сортируются по триграммному сходству.
+"""
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+from rest_framework.filters import SearchFilter
+
+
+class RankedSearchFilter(SearchFilter):
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+        if connection.vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        lookups = [
+            self.construct_search(str(field), queryset)
+            for field in search_fields
+        ]
+        for term in search_terms:
+            condition = Q()
+            for lookup in lookups:
+                path, lookup_name = lookup.rsplit("__", 1)
+                condition |= self.lookup_condition(
+                    queryset.model, path, lookup_name, term
+                )
+            queryset = queryset.filter(condition)
+
+        fields = [field.lstrip("^=@$") for field in search_fields]
+        similarities = [
+            TrigramWordSimilarity(term, field)
+            for term in search_terms
+            for field in fields
+        ]
+        rank = (
+            Greatest(*similarities)
+            if len(similarities) > 1
+            else similarities[0]
+        )
+        return queryset.annotate(search_rank=rank).order_by(
+            "-search_rank", "pk"
+        )
+
+    @classmethod
+    def lookup_condition(cls, model, path, lookup_name, term):
+        name, _, rest = path.partition("__")
+        if not rest:
+            return Q(**{f"{name}__{lookup_name}": term})
+        related = model._meta.get_field(name).related_model
+        subquery = related._default_manager.filter(
+            cls.lookup_condition(related, rest, lookup_name, term)
+        ).values("pk")
+        return Q(**{f"{name}__in": subquery})
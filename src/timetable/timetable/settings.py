@@ -23,6 +23,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "corsheaders",
@@ -31,9 +32,12 @@ INSTALLED_APPS = [
     "educational_plan.apps.EducationalPlanConfig",
     "group_educational_plan.apps.GroupEducationalPlanConfig",
     "groups.apps.GroupsConfig",
+    "jobs.apps.JobsConfig",
+    "schedule.apps.ScheduleConfig",
     "subject.apps.SubjectConfig",
     "teacher.apps.TeacherConfig",
     "teacher_profile.apps.TeacherProfileConfig",
+    "timetable.apps.TimetableConfig",
     "user.apps.UserConfig",
 ]
 MIDDLEWARE = [
@@ -104,6 +108,18 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "timetable.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "timetable.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    "DEFAULT_PAGINATION_CLASS": (
+        "timetable.pagination.OptionalCursorPagination"
+    ),
 }
 
 LANGUAGE_CODE = "en-us"
@@ -116,6 +132,18 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+SCHEDULE_OCCUPANCY_MAX_AGE = config(
+    "SCHEDULE_OCCUPANCY_MAX_AGE", default=300, cast=int
+)
+AUTOCOMPLETE_VERSION_TTL = config(
+    "AUTOCOMPLETE_VERSION_TTL", default=5, cast=int
+)
+CALENDAR_CACHE_TIMEOUT = config(
+    "CALENDAR_CACHE_TIMEOUT", default=24 * 60 * 60, cast=int
+)
+JOBS_STALE_TIMEOUT = config("JOBS_STALE_TIMEOUT", default=10 * 60, cast=int)
+JOBS_MAX_ATTEMPTS = config("JOBS_MAX_ATTEMPTS", default=3, cast=int)
+
 CORS_ALLOWED_ORIGIN_REGEXES = config(
     "CORS_ALLOWED_ORIGIN_REGEXES",
     default=r"^https:\/\/(?:.*\.)?updspace\.com$",
@@ -0,0 +1,95 @@
+"""
+Выборочные поля ответа: ``?fields=id,name`` и ``?omit=entries``.
+
+``SparseFieldsSerializerMixin`` убирает лишние поля сериализатора на
+чтении, ``SparseFieldsViewSetMixin`` по оставшимся полям сужает
+``only()`` и ``select_related()`` выборки. Источник поля берётся из
+``source``; для полей-методов и свойств колонки перечисляются в
+``Meta.sparse_sources``. Если источник определить не удалось, выборка
+не сужается.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+
+from rest_framework.permissions import SAFE_METHODS
+
+from .params import split_list
+
+
+def _parse(value):
+    return set(split_list(value))
+
+
+def requested_fields(request):
+    params = request.query_params
+    fields = _parse(params["fields"]) if "fields" in params else None
+    return fields, _parse(params.get("omit", ""))
+
+
+def _model_path(model, source):
+    parts = []
+    for attr in source.split("."):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        parts.append(attr)
+        if not field.is_relation:
+            break
+        model = field.related_model
+    return "__".join(parts)
+
+
+def model_paths(serializer, model):
+    meta = getattr(serializer, "Meta", None)
+    sources = getattr(meta, "sparse_sources", {})
+    paths = {model._meta.pk.name}
+    for name, field in serializer.fields.items():
+        if name in sources:
+            candidates = sources[name]
+        elif field.source == "*":
+            return None
+        else:
+            candidates = [field.source]
+        for source in candidates:
+            path = _model_path(model, source)
+            if path is None:
+                return None
+            paths.add(path)
+    return paths
+
+
+class SparseFieldsSerializerMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return
+        fields, omit = requested_fields(request)
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or name in omit:
+                self.fields.pop(name)
+
+
+class SparseFieldsViewSetMixin:
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action not in ("list", "retrieve"):
+            return queryset
+        fields, omit = requested_fields(self.request)
+        if fields is None and not omit:
+            return queryset
+        paths = model_paths(self.get_serializer(), queryset.model)
+        if paths is None:
+            return queryset
+        relations = {
+            "__".join(parts[:i])
+            for parts in (path.split("__") for path in paths)
+            for i in range(1, len(parts))
+        }
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*paths)
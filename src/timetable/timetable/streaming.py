@@ -0,0 +1,54 @@
+"""
+Потоковая выгрузка списков в NDJSON: ``?format=ndjson``.
+
+Выборка читается через ``iterator(chunk_size=...)`` и сериализуется
+построчно, поэтому память воркера не зависит от размера таблицы.
+Пагинация в этом режиме не применяется, фильтры, поиск и
+``?fields=``/``?omit=`` — применяются.
+"""
+
+from django.http import StreamingHttpResponse
+
+from rest_framework.renderers import BaseRenderer
+
+from .renderers import ORJSONRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Сюда попадают ответы, которые не стримятся: объект или ошибка
+        # становятся одной строкой, список — строкой на элемент.
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return b"".join(dump(row) for row in rows)
+
+
+_json = ORJSONRenderer()
+
+
+def dump(row):
+    return _json.render(row) + b"\n"
+
+
+class StreamingListMixin:
+    stream_chunk_size = 2000
+
+    def get_renderers(self):
+        return [*super().get_renderers(), NDJSONRenderer()]
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format != NDJSONRenderer.format:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        return StreamingHttpResponse(
+            (dump(serializer.to_representation(obj)) for obj in rows),
+            content_type=NDJSONRenderer.media_type,
+        )
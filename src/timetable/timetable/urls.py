@@ -6,7 +6,7 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
-from .views import health
+from .views import autocomplete, health
 
 urlpatterns = [
     path("health/", health),
@@ -19,13 +19,15 @@ urlpatterns = [
         "api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"
     ),
     #
+    path("api/autocomplete/", autocomplete),
     path("api/", include("brigade_assignment.urls")),
     path("api/", include("educational_plan.urls")),
     path("api/", include("group_educational_plan.urls")),
     path("api/", include("groups.urls")),
+    path("api/", include("jobs.urls")),
+    path("api/", include("schedule.urls")),
     path("api/", include("teacher.urls")),
     path("api/", include("teacher_profile.urls")),
     path("api/", include("subject.urls")),
     path("api/user/", include("user.urls")),
-    # path("api/", include("schedule.urls")),
 ]
@@ -0,0 +1,62 @@
+"""
+Версии справочных таблиц.
+
+Версия модели увеличивается сигналами ``post_save``/``post_delete``
+(см. ``receivers.py``), а там, где записи меняются через
+``bulk_create``/``bulk_update`` без сигналов, — явным вызовом
+``bump()``.
+"""
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ModelVersion
+
+VERSIONED_MODELS = [
+    "educational_plan.EducationalPlan",
+    "educational_plan.EducationalPlanEntry",
+    "group_educational_plan.GroupEducationalPlan",
+    "groups.Group",
+    "subject.Subject",
+    "teacher.Teacher",
+    "teacher.TeacherUnavailableDates",
+    "teacher_profile.TeacherProfile",
+]
+
+
+def version_label(model):
+    if isinstance(model, str):
+        return model.lower()
+    return model._meta.label_lower
+
+
+def bump(*models):
+    labels = {version_label(model) for model in models}
+    now = timezone.now()
+    updated = ModelVersion.objects.filter(label__in=labels).update(
+        version=F("version") + 1, updated_at=now
+    )
+    if updated < len(labels):
+        existing = set(
+            ModelVersion.objects.filter(label__in=labels).values_list(
+                "label", flat=True
+            )
+        )
+        ModelVersion.objects.bulk_create(
+            [
+                ModelVersion(label=label, version=1, updated_at=now)
+                for label in labels - existing
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def get_versions(models):
+    labels = sorted({version_label(model) for model in models})
+    found = {
+        label: (version, updated_at)
+        for label, version, updated_at in ModelVersion.objects.filter(
+            label__in=labels
+        ).values_list("label", "version", "updated_at")
+    }
+    return {label: found.get(label, (0, None)) for label in labels}
@@ -1,7 +1,30 @@
 from http import HTTPStatus
 
+from rest_framework import serializers
+from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
+from .autocomplete import indexes
+
 
 def health(request):
     return Response("<p>Alive<p/>", status=HTTPStatus.OK)
+
+
+class AutocompleteSerializer(serializers.Serializer):
+    q = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    kind = serializers.ChoiceField(choices=sorted(indexes))
+    limit = serializers.IntegerField(
+        min_value=1, max_value=50, required=False, default=10
+    )
+
+
+@api_view(["GET"])
+def autocomplete(request):
+    serializer = AutocompleteSerializer(data=request.query_params)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+    return Response(
+        indexes[data["kind"]].search(data["q"], data["limit"]),
+        status=HTTPStatus.OK,
+    )
@@ -0,0 +1,47 @@
+"""
+Выгрузка таблиц в xlsx.
+
+Книга открывается в режиме ``write_only``: строки сразу уходят во
+временный файл openpyxl, поэтому память не зависит от их количества.
+Источник строк — генератор поверх ``queryset.iterator()``.
+"""
+
+import tempfile
+
+from django.http import FileResponse
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+)
+
+
+def write_table(file, title, columns, rows):
+    """``columns`` — пары (заголовок, ширина столбца)."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    for index, (_, width) in enumerate(columns, 1):
+        sheet.column_dimensions[get_column_letter(index)].width = width
+    sheet.freeze_panes = "A2"
+    header = []
+    for name, _ in columns:
+        cell = WriteOnlyCell(sheet, value=name)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file)
+
+
+def xlsx_response(write, filename):
+    file = tempfile.TemporaryFile()
+    write(file)
+    file.seek(0)
+    return FileResponse(
+        file, as_attachment=True, filename=filename, content_type=CONTENT_TYPE
+    )